@@ -3,6 +3,7 @@ This module defines the Property class and property arithmetics.
 """
 
 from dataclasses import dataclass, replace
+from functools import lru_cache
 from typing import Type, Optional, ClassVar
 from math import isclose
 
@@ -21,7 +22,13 @@ from property_utils.units.descriptors import (
 # pylint: disable=unused-wildcard-import, wildcard-import
 from property_utils.units.converters import *
 from property_utils.units.units import NonDimensionalUnit
-from property_utils.units.converter_types import UnitConverter, get_converter
+from property_utils.units.converter_types import (
+    UnitConverter,
+    get_converter,
+    _DescriptorKey,
+    _descriptor_key,
+    _descriptor_from_key,
+)
 from property_utils.exceptions.units.converter_types import UndefinedConverterError
 from property_utils.exceptions.properties.property import (
     PropertyValidationError,
@@ -51,6 +58,28 @@ def p(
     return Property(value, unit)
 
 
+def _unit_converter(unit: UnitDescriptor) -> Type[UnitConverter]:
+    """
+    Returns the converter for the generic of the given unit. Results are cached per
+    unit, so that the generic is not rebuilt for every property of the same units.
+
+    Raises `UndefinedConverter` if a converter is not defined.
+    """
+    key = _descriptor_key(unit)
+    if key is None:
+        return get_converter(unit.to_generic())
+    return _cached_unit_converter(key)
+
+
+@lru_cache(maxsize=128)
+def _cached_unit_converter(key: _DescriptorKey) -> Type[UnitConverter]:
+    """
+    Returns the converter for the unit the given key was made from; see
+    `_descriptor_key`.
+    """
+    return get_converter(_descriptor_from_key(key).to_generic())
+
+
 @dataclass
 class Property:
     """
@@ -60,9 +89,11 @@ class Property:
     For example, a Property with length units and negative value is valid.
     """
 
+    __slots__ = ("value", "unit", "unit_converter")
+
     value: float
     unit: UnitDescriptor
-    unit_converter: Optional[Type[UnitConverter]] = None
+    unit_converter: Optional[Type[UnitConverter]]
     default_units: ClassVar[Optional[UnitDescriptor]] = None
 
     def __init__(self, value: float, unit: Optional[UnitDescriptor] = None) -> None:
@@ -82,6 +113,7 @@ class Property:
 
         self.value = value
         self.unit = unit
+        self.unit_converter = None
 
     def eq(self, other: "Property", *, rel_tol=1e-9, abs_tol=0) -> bool:
         """
@@ -112,15 +144,19 @@ class Property:
         """
         if not isinstance(other, Property):
             return False
-        if not self.unit.isinstance_equivalent(other.unit.to_generic()):
+        if self.unit == other.unit:
+            prop = other
+        elif not self.unit.isinstance_equivalent(other.unit.to_generic()):
             return False
-        try:
-            prop = other.to_unit(self.unit) if self.unit != other.unit else other
-        except PropertyUtilsException as exc:
-            raise PropertyBinaryOperationError(
-                f"during conversion of {other} to ({self.unit}) units an error occured: ",
-                exc,
-            ) from None
+        else:
+            try:
+                prop = other.to_unit(self.unit)
+            except PropertyUtilsException as exc:
+                raise PropertyBinaryOperationError(
+                    f"during conversion of {other} to ({self.unit}) units an error "
+                    "occured: ",
+                    exc,
+                ) from None
         return isclose(self.value, prop.value, rel_tol=rel_tol, abs_tol=abs_tol)
 
     def to_si(self) -> Self:
@@ -447,10 +483,12 @@ class Property:
         """
         if not isinstance(other, Property):
             return False
+        if self.unit == other.unit:
+            return self.value == other.value
         if not self.unit.isinstance_equivalent(other.unit.to_generic()):
             return False
         try:
-            prop = other.to_unit(self.unit) if self.unit != other.unit else other
+            prop = other.to_unit(self.unit)
         except PropertyUtilsException as exc:
             raise PropertyBinaryOperationError(
                 f"during conversion of {other} to ({self.unit}) units an error occured: ",
@@ -599,7 +637,7 @@ class Property:
         """
         Raises `UndefinedConverter` if a converter is not defined.
         """
-        return get_converter(self.unit.to_generic())
+        return _unit_converter(self.unit)
 
     def _validate_comparison_input(self, other) -> None:
         """
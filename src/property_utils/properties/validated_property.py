@@ -36,6 +36,8 @@ class ValidatedProperty(Property):
         <NauticalDistance: 45.2 NM>
     """
 
+    __slots__ = ()
+
     generic_unit_descriptor: ClassVar[GenericUnitDescriptor]
     default_units: ClassVar[Optional[UnitDescriptor]] = None
 
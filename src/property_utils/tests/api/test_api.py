@@ -12,7 +12,7 @@ class TestPublicPropertyOperations(TestCase):
         return op(p1, p2)
 
     def assert_result(self, result_str):
-        self.assertSequenceEqual(str(self.result()), result_str, str)
+        self.assertEqual(str(self.result()), result_str)
 
     @args(
         {
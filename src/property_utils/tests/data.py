@@ -339,6 +339,15 @@ def generic_composite_dimension() -> GenericCompositeDimension:
     )
 
 
+class UnhashableDimension(Dimension):
+    """
+    A dimension that converters cannot make a cache key for.
+    """
+
+    __slots__ = ()
+    __hash__ = None  # type: ignore[assignment]
+
+
 class BiggerThan5Prop(ValidatedProperty):
     generic_unit_descriptor = Unit1
 
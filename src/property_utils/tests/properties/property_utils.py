@@ -1,4 +1,6 @@
+import re
 from abc import abstractmethod
+from math import isclose
 
 from unittest_extensions import TestCase
 
@@ -11,10 +13,21 @@ from property_utils.exceptions.properties.property import (
 from property_utils.exceptions.units.converter_types import UnitConversionError
 from property_utils.exceptions.base import PropertyUtilsException
 
+# matches any error message; used when no expected regex is given.
+_ANY = re.compile(r".*", re.S)
+
 
 class TestProperty(TestCase):
+    # pytest does not collect the base class; subclasses are collected unless they
+    # set `__test__` themselves.
+    __test__ = False
+
     _method: str
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.__test__ = cls.__dict__.get("__test__", True)
+
     def setUp(self) -> None:
         self._prop = None
 
@@ -43,16 +56,25 @@ class TestProperty(TestCase):
 
     def assert_result(self, result_str):
         self.assertResultIsNot(self.prop())
-        self.assertSequenceEqual(str(self.cachedResult()), result_str, str)
+        self.assertEqual(str(self.cachedResult()), result_str)
+
+    def assert_close(self, value, unit, rel_tol=1e-9, abs_tol=0.0):
+        self.assertResultIsNot(self.prop())
+        result = self.cachedResult()
+        self.assertTrue(
+            isclose(result.value, value, rel_tol=rel_tol, abs_tol=abs_tol),
+            f"{result.value} != {value} within tolerance",
+        )
+        self.assertEqual(result.unit, unit)
 
     def assert_result_almost(self, result_str):
         self.assertResultIsNot(self.prop())
         result = self.cachedResult()
         result.value = round(result.value, 2)
-        self.assertSequenceEqual(str(result), result_str, str)
+        self.assertEqual(str(result), result_str)
 
     def _assert_error(self, error: PropertyUtilsException, expected_regex):
-        if expected_regex is None:
-            self.assertResultRaises(error)
-        else:
-            self.assertResultRaisesRegex(error, expected_regex)
+        with self.assertRaisesRegex(
+            error, _ANY if expected_regex is None else expected_regex
+        ):
+            self.result()
@@ -1,12 +1,13 @@
-from unittest import TestSuite, TextTestRunner
-from operator import mul
+from unittest import main
+from operator import mul, gt, ge, lt, le
 
 from unittest_extensions import args, TestCase
 
-from property_utils.properties.property import Property, p
+from property_utils.properties.property import Property, p, _cached_unit_converter
 from property_utils.units.units import NonDimensionalUnit, PressureUnit
 from property_utils.exceptions.properties.property import (
     PropertyExponentError,
+    PropertyBinaryOperationError,
 )
 from property_utils.tests.data import (
     Unit1,
@@ -19,22 +20,17 @@ from property_utils.tests.data import (
     PropUnit2,
     generic_dimension_1,
     generic_composite_dimension,
+    Unit1Converter,
+    Unit1_2Converter,
+    Unit1_314Converter,
+    UnhashableDimension,
 )
-from property_utils.tests.utils import add_to, def_load_tests
+from property_utils.tests.utils import def_load_tests, assert_cases
 from property_utils.tests.properties.property_utils import TestProperty
 
-
 load_tests = def_load_tests("property_utils.properties.property")
 
-property_test_suite = TestSuite()
-
-
-if __name__ == "__main__":
-    runner = TextTestRunner()
-    runner.run(property_test_suite)
-
 
-@add_to(property_test_suite)
 class TestPropertyInit(TestProperty):
     def subject(self, value, unit):
         return Property(value, unit)
@@ -68,7 +64,42 @@ class TestPropertyInit(TestProperty):
         self.assertIsNone(self.result().unit_converter)
 
 
-@add_to(property_test_suite)
+class TestPropertyUnitConverter(TestCase):
+    """
+    The converter of a property is resolved on its first conversion and cached per
+    snapshot of its unit.
+    """
+
+    def test_with_measurement_unit(self):
+        prop = Property(2, Unit1.A)
+        prop.to_unit(Unit1.a)
+        self.assertIs(prop.unit_converter, Unit1Converter)
+
+    def test_with_equal_units(self):
+        Property(2, Unit1.A**2).to_unit(Unit1.a**2)
+        before = _cached_unit_converter.cache_info()
+        prop = Property(2, Unit1.A**2)
+        prop.to_unit(Unit1.a**2)
+        self.assertIs(prop.unit_converter, Unit1_2Converter)
+        self.assertEqual(_cached_unit_converter.cache_info().hits, before.hits + 1)
+
+    def test_with_unkeyable_unit(self):
+        prop = Property(2, UnhashableDimension(Unit1.A, 2))
+        before = _cached_unit_converter.cache_info()
+        self.assertEqual(str(prop.to_unit(Unit1.a**2)), "200.0 (a^2)")
+        self.assertIs(prop.unit_converter, Unit1_2Converter)
+        self.assertEqual(_cached_unit_converter.cache_info(), before)
+
+    def test_after_unit_mutation(self):
+        unit = Unit1.A**2
+        Property(2, unit).to_unit(Unit1.a**2)
+        # `**` raises the power of a dimension in place.
+        unit**1.57
+        prop = Property(2, unit)
+        self.assertEqual(str(prop.to_unit(Unit1.a**3.14)), f"{2 * 10**3.14} (a^3.14)")
+        self.assertIs(prop.unit_converter, Unit1_314Converter)
+
+
 class TestPropertyDefaultUnits(TestProperty):
     def subject(self, **kwargs):
         return PropUnit1(**kwargs)
@@ -82,7 +113,6 @@ class TestPropertyDefaultUnits(TestProperty):
         self.assert_result("1 a")
 
 
-@add_to(property_test_suite)
 class TestPropertyWithoutDefaultUnits(TestProperty):
     def subject(self, value):
         return PropUnit2(value)
@@ -92,7 +122,6 @@ class TestPropertyWithoutDefaultUnits(TestProperty):
         self.assert_validation_error()
 
 
-@add_to(property_test_suite)
 class TestPropertyConstructor(TestCase):
     def subject(self, **kwargs):
         return p(**kwargs)
@@ -106,8 +135,8 @@ class TestPropertyConstructor(TestCase):
         self.assertEqual(self.result().unit, PressureUnit.BAR)
 
 
-@add_to(property_test_suite, "eq")
 class TestPropertyEq(TestProperty):
+    _method = "eq"
 
     def build_property(self):
         return Property(33.333333, Unit1.A)
@@ -157,8 +186,9 @@ class TestPropertyEq(TestProperty):
         self.assert_invalid_operation()
 
 
-@add_to(property_test_suite, "eq")
 class TestAliasPropertyEq(TestProperty):
+    _method = "eq"
+
     def build_property(self):
         return Property(10, Unit8.H)
 
@@ -187,7 +217,23 @@ class TestAliasPropertyEq(TestProperty):
         self.assertResultTrue()
 
 
-@add_to(property_test_suite)
+class TestCompositePropertyEq(TestProperty):
+    _method = "eq"
+
+    def build_property(self):
+        return Property(-22.2, Unit1.A * Unit4.D)
+
+    @args({"other": Property(-222, Unit1.a * Unit4.D)})
+    def test_with_other_units(self):
+        self.assertResultTrue()
+
+    @args(
+        {"other": Property(-222, Unit1.a * Unit4.D), "abs_tol": 1e-20, "rel_tol": 1e-20}
+    )
+    def test_with_other_units_without_tolerance(self):
+        self.assertResultFalse()
+
+
 class TestPropertyToSi(TestProperty):
     def subject(self, unit):
         return Property(200, unit).to_si()
@@ -225,8 +271,8 @@ class TestPropertyToSi(TestProperty):
         self.assert_impossible_conversion()
 
 
-@add_to(property_test_suite, "to_unit")
 class TestSimplePropertyToUnit(TestProperty):
+    _method = "to_unit"
 
     def build_property(self):
         return Property(105, Unit1.A)
@@ -241,15 +287,15 @@ class TestSimplePropertyToUnit(TestProperty):
 
     @args({"unit": Unit1.a})
     def test_with_other_unit(self):
-        self.assert_result("1050.0 a")
+        self.assert_close(1050, Unit1.a)
 
     @args({"unit": Unit1.A2})
     def test_with_unregistered_unit(self):
         self.assert_invalid_conversion()
 
 
-@add_to(property_test_suite, "to_unit")
 class TestPropertyToUnit(TestProperty):
+    _method = "to_unit"
 
     def build_property(self):
         return Property(52, Unit1.A**2)
@@ -264,15 +310,15 @@ class TestPropertyToUnit(TestProperty):
 
     @args({"unit": Unit1.a**2})
     def test_with_other_unit(self):
-        self.assert_result("5200.0 (a^2)")
+        self.assert_close(5200, Unit1.a**2)
 
     @args({"unit": Unit1.A2**2})
     def test_with_unregistered_unit(self):
         self.assert_invalid_conversion()
 
 
-@add_to(property_test_suite, "to_unit")
 class TestCompositePropertyToUnit(TestProperty):
+    _method = "to_unit"
 
     def build_property(self):
         return Property(20, (Unit1.A**2) / (Unit4.D**3))
@@ -287,14 +333,13 @@ class TestCompositePropertyToUnit(TestProperty):
 
     @args({"unit": (Unit1.a**2) / (Unit4.d**3)})
     def test_with_other_unit(self):
-        self.assert_result("16.0 (a^2) / (d^3)")
+        self.assert_close(16, Unit1.a**2 / Unit4.d**3)
 
     @args({"unit": (Unit1.A2**2) / (Unit4.D**3)})
     def test_with_unregistered_unit(self):
         self.assert_invalid_conversion()
 
 
-@add_to(property_test_suite)
 class TestPropertyNegation(TestProperty):
     def subject(self, value):
         return -Property(value, Unit1.A).value
@@ -308,8 +353,8 @@ class TestPropertyNegation(TestProperty):
         self.assertResult(7)
 
 
-@add_to(property_test_suite, "__mul__")
 class TestPropertyMultiplication(TestProperty):
+    _method = "__mul__"
 
     def build_property(self):
         return Property(5.2, Unit1.A)
@@ -376,8 +421,8 @@ class TestPropertyMultiplicationResultClass(TestProperty):
         self.assertResultIsInstance(PropUnit1)
 
 
-@add_to(property_test_suite, "__mul__")
 class TestCompositeDimensionPropertyUnitPreconversionMultiplication(TestProperty):
+    _method = "__mul__"
 
     def build_property(self) -> Property:
         return Property(1, Unit1.A * Unit4.d**2 / Unit6.F / Unit8.H**3)
@@ -411,8 +456,8 @@ class TestCompositeDimensionPropertyUnitPreconversionMultiplication(TestProperty
         self.assert_result("1.0 (d^2) * A / (H^3)")
 
 
-@add_to(property_test_suite, "__mul__")
 class TestDimensionPropertyUnitPreconversionMultiplication(TestProperty):
+    _method = "__mul__"
 
     def build_property(self) -> Property:
         return Property(1, Unit1.A**2)
@@ -438,8 +483,8 @@ class TestDimensionPropertyUnitPreconversionMultiplication(TestProperty):
         self.assert_result("1.0 (A^3)")
 
 
-@add_to(property_test_suite, "__mul__")
 class TestUnitPropertyUnitPreconversionMultiplication(TestProperty):
+    _method = "__mul__"
 
     def build_property(self) -> Property:
         return Property(1, Unit1.A)
@@ -465,8 +510,8 @@ class TestUnitPropertyUnitPreconversionMultiplication(TestProperty):
         self.assert_result("1.0 (A^2)")
 
 
-@add_to(property_test_suite, "__truediv__")
 class TestPropertyDivision(TestProperty):
+    _method = "__truediv__"
 
     def build_property(self):
         return Property(6, Unit1.A)
@@ -520,8 +565,8 @@ class TestPropertyDivision(TestProperty):
         self.assert_invalid_operation()
 
 
-@add_to(property_test_suite, "__truediv__")
 class TestCompositeDimensionPropertyUnitPreconversionDivision(TestProperty):
+    _method = "__truediv__"
 
     def build_property(self) -> Property:
         return Property(1, Unit1.A * Unit4.d**2 / Unit6.F / Unit8.H**3)
@@ -555,8 +600,8 @@ class TestCompositeDimensionPropertyUnitPreconversionDivision(TestProperty):
         self.assert_result("1.0 (d^2) * A / (F^2) / (H^3)")
 
 
-@add_to(property_test_suite, "__truediv__")
 class TestDimensionPropertyUnitPreconversionDivision(TestProperty):
+    _method = "__truediv__"
 
     def build_property(self) -> Property:
         return Property(1, Unit1.A**2)
@@ -582,8 +627,8 @@ class TestDimensionPropertyUnitPreconversionDivision(TestProperty):
         self.assert_result("1.0 A")
 
 
-@add_to(property_test_suite, "__truediv__")
 class TestUnitPropertyUnitPreconversionDivision(TestProperty):
+    _method = "__truediv__"
 
     def build_property(self) -> Property:
         return Property(1, Unit1.A)
@@ -609,8 +654,8 @@ class TestUnitPropertyUnitPreconversionDivision(TestProperty):
         self.assert_result("1.0 ")
 
 
-@add_to(property_test_suite, "__rtruediv__")
 class TestPropertyRightDivision(TestProperty):
+    _method = "__rtruediv__"
 
     def build_property(self):
         return Property(10, Unit1.A)
@@ -664,8 +709,8 @@ class TestPropertyRightDivision(TestProperty):
         self.assert_result("0.0 A / (B^3)")
 
 
-@add_to(property_test_suite, "__add__")
 class TestSimpleProppertyAddition(TestProperty):
+    _method = "__add__"
 
     def build_property(self):
         return Property(2.3, Unit1.A)
@@ -684,7 +729,7 @@ class TestSimpleProppertyAddition(TestProperty):
 
     @args({"other": Property(30, Unit1.a)})
     def test_with_other_units_property(self):
-        self.assert_result("5.3 A")
+        self.assert_close(5.3, Unit1.A)
 
     @args({"other": Property(5, Unit1.A)})
     def test_with_same_units_property(self):
@@ -699,8 +744,8 @@ class TestSimpleProppertyAddition(TestProperty):
         self.assert_result("2.3 A")
 
 
-@add_to(property_test_suite, "__add__")
 class TestPropertyAddition(TestProperty):
+    _method = "__add__"
 
     def build_property(self):
         return Property(5, Unit1.A * Unit2.B / Unit4.D)
@@ -718,8 +763,8 @@ class TestPropertyAddition(TestProperty):
         self.assert_invalid_operation()
 
 
-@add_to(property_test_suite, "__add__")
 class TestPropertyAdditionWithUnregisteredUnitConverter(TestProperty):
+    _method = "__add__"
 
     def build_property(self):
         return Property(10, Unit3.C)
@@ -733,8 +778,9 @@ class TestPropertyAdditionWithUnregisteredUnitConverter(TestProperty):
         self.assert_invalid_operation()
 
 
-@add_to(property_test_suite, "__add__")
 class TestAliasPropertyAddition(TestProperty):
+    _method = "__add__"
+
     def build_property(self) -> Property:
         return Property(15, Unit8.H)
 
@@ -755,7 +801,6 @@ class TestAliasPropertyAddition(TestProperty):
         self.assert_result("25.0 H")
 
 
-@add_to(property_test_suite)
 class TestDifferentPropertyAddition(TestProperty):
     def subject(self, left, right):
         return left + right
@@ -769,8 +814,8 @@ class TestDifferentPropertyAddition(TestProperty):
         self.assert_result("20 a")
 
 
-@add_to(property_test_suite, "__sub__")
 class TestSimplePropertySubtraction(TestProperty):
+    _method = "__sub__"
 
     def build_property(self):
         return Property(15, Unit1.A)
@@ -804,8 +849,8 @@ class TestSimplePropertySubtraction(TestProperty):
         self.assert_result("15.0 A")
 
 
-@add_to(property_test_suite, "__sub__")
 class TestPropertySubtraction(TestProperty):
+    _method = "__sub__"
 
     def build_property(self):
         return Property(5, Unit1.A**2 / Unit2.B / Unit4.D)
@@ -823,8 +868,8 @@ class TestPropertySubtraction(TestProperty):
         self.assert_invalid_operation()
 
 
-@add_to(property_test_suite, "__sub__")
 class TestPropertySubtractionWithUnregisteredUnitConverter(TestProperty):
+    _method = "__sub__"
 
     def build_property(self):
         return Property(2, Unit3.C)
@@ -838,8 +883,9 @@ class TestPropertySubtractionWithUnregisteredUnitConverter(TestProperty):
         self.assert_invalid_operation()
 
 
-@add_to(property_test_suite, "__sub__")
 class TestAliasPropertySubtraction(TestProperty):
+    _method = "__sub__"
+
     def build_property(self) -> Property:
         return Property(25, Unit8.H)
 
@@ -860,7 +906,6 @@ class TestAliasPropertySubtraction(TestProperty):
         self.assert_result("15.0 H")
 
 
-@add_to(property_test_suite)
 class TestDifferentPropertySubtraction(TestProperty):
     def subject(self, prop):
         return PropUnit1(10) - prop
@@ -870,8 +915,8 @@ class TestDifferentPropertySubtraction(TestProperty):
         self.assert_result("5 a")
 
 
-@add_to(property_test_suite, "__rsub__")
 class TestSimplePropertyRightSubtraction(TestProperty):
+    _method = "__rsub__"
 
     def build_property(self):
         return Property(2.5, Unit1.A)
@@ -901,8 +946,9 @@ class TestSimplePropertyRightSubtraction(TestProperty):
         self.assert_result("-5.0 A")
 
 
-@add_to(property_test_suite, "__rsub__")
 class TestAliasPropertyRightSubtraction(TestProperty):
+    _method = "__rsub__"
+
     def build_property(self) -> Property:
         return Property(25, Unit8.H)
 
@@ -919,7 +965,6 @@ class TestAliasPropertyRightSubtraction(TestProperty):
         self.assert_result("-60.0 f / (d^2)")
 
 
-@add_to(property_test_suite)
 class TestDifferentPropertyRightSubtraction(TestProperty):
     def subject(self, prop):
         return prop - PropUnit1(5)
@@ -929,8 +974,8 @@ class TestDifferentPropertyRightSubtraction(TestProperty):
         self.assert_result("5 a")
 
 
-@add_to(property_test_suite, "__pow__")
 class TestPropertyExponentiation(TestProperty):
+    _method = "__pow__"
 
     def build_property(self):
         return Property(4, Unit1.A)
@@ -952,8 +997,19 @@ class TestPropertyExponentiation(TestProperty):
         self.assert_result("2.0 (A^0.5)")
 
 
-@add_to(property_test_suite, "__eq__")
+class TestLargePropertyExponentiation(TestProperty):
+    _method = "__pow__"
+
+    def build_property(self):
+        return Property(1e200, Unit1.A)
+
+    @args({"power": 2})
+    def test_with_overflowing_value(self):
+        self.assertResultRaises(OverflowError)
+
+
 class TestPropertyEquality(TestProperty):
+    _method = "__eq__"
 
     def build_property(self):
         return Property(-22.2, Unit1.A * Unit4.D)
@@ -970,7 +1026,7 @@ class TestPropertyEquality(TestProperty):
     def test_with_other_unit_type(self):
         self.assertResultFalse()
 
-    # this test will fail due to floating point equality
+    # '==' does not apply a tolerance; see TestCompositePropertyEq
     @args({"other": Property(-222, Unit1.a * Unit4.D)})
     def test_with_other_units(self):
         self.assertResultFalse()
@@ -987,7 +1043,7 @@ class TestPropertyEquality(TestProperty):
     def test_with_same_prop(self):
         self.assertResultTrue()
 
-    # this test is false due to floating point inequality
+    # '==' does not apply a tolerance; see TestCompositePropertyEq
     @args({"other": Property(-222, Unit1.a * Unit4.D)})
     def test_with_other_units_same_value(self):
         self.assertResultFalse()
@@ -997,8 +1053,8 @@ class TestPropertyEquality(TestProperty):
         self.assertResultFalse()
 
 
-@add_to(property_test_suite, "__eq__")
 class TestPropertyWithUnregistedUnitsEquality(TestProperty):
+    _method = "__eq__"
 
     def build_property(self):
         return Property(5, Unit3.C)
@@ -1016,8 +1072,8 @@ class TestPropertyWithUnregistedUnitsEquality(TestProperty):
         self.assertResultTrue()
 
 
-@add_to(property_test_suite, "__ne__")
 class TestPropertyInequality(TestProperty):
+    _method = "__ne__"
 
     def build_property(self):
         return Property(-22.2, Unit1.A * Unit4.D)
@@ -1034,7 +1090,7 @@ class TestPropertyInequality(TestProperty):
     def test_with_other_unit_type(self):
         self.assertResultTrue()
 
-    # this test is True due to floating point inequality
+    # '!=' does not apply a tolerance; see TestCompositePropertyEq
     @args({"other": Property(-222, Unit1.a * Unit4.D)})
     def test_with_other_units(self):
         self.assertResultTrue()
@@ -1051,7 +1107,7 @@ class TestPropertyInequality(TestProperty):
     def test_with_same_prop(self):
         self.assertResultFalse()
 
-    # this test is true due to floating point inequality
+    # '!=' does not apply a tolerance; see TestCompositePropertyEq
     @args({"other": Property(-222, Unit1.a * Unit4.D)})
     def test_with_other_units_same_value(self):
         self.assertResultTrue()
@@ -1061,8 +1117,8 @@ class TestPropertyInequality(TestProperty):
         self.assertResultTrue()
 
 
-@add_to(property_test_suite, "__ne__")
 class TestPropertyWithUnregistedUnitsInequality(TestProperty):
+    _method = "__ne__"
 
     def build_property(self):
         return Property(5, Unit3.C)
@@ -1080,353 +1136,377 @@ class TestPropertyWithUnregistedUnitsInequality(TestProperty):
         self.assertResultFalse()
 
 
-@add_to(property_test_suite, "__gt__")
-class TestPropertyGreater(TestProperty):
-
-    def build_property(self) -> Property:
-        return Property(12, Unit1.A / Unit4.D)
-
-    @args({"other": 4})
-    def test_with_numeric(self):
-        self.assert_invalid_operation()
-
-    @args({"other": Property(20, Unit1.A)})
-    def test_with_other_unit_type(self):
-        self.assert_invalid_operation()
-
-    @args({"other": Property(130, Unit1.a / Unit4.D)})
-    def test_with_other_units(self):
-        self.assertResultFalse()
-
-    @args({"other": Property(22.2, (Unit1.A * Unit4.D).inverse())})
-    def test_with_inverse_units(self):
-        self.assert_invalid_operation()
-
-    @args({"other": Property(1, Unit1.A2 / Unit4.D)})
-    def test_with_unregistered_unit(self):
-        self.assert_invalid_operation()
-
-    @args({"other": Property(12, Unit1.A / Unit4.D)})
-    def test_with_same_prop(self):
-        self.assertResultFalse()
-
-    @args({"other": Property(120, Unit1.a / Unit4.D)})
-    def test_with_other_units_same_value(self):
-        self.assertResultFalse()
-
-    @args({"other": Property(-12, Unit1.A / Unit4.D)})
-    def test_with_negative_prop(self):
-        self.assertResultTrue()
-
-    @args({"other": Property(13, Unit1.A / Unit4.D)})
-    def test_with_bigger_prop(self):
-        self.assertResultFalse()
-
-
-@add_to(property_test_suite, "__gt__")
-class TestPropertyWithUnregistedUnitsGreater(TestProperty):
-
-    def build_property(self):
-        return Property(5, Unit3.C)
-
-    @args({"other": Property(6, Unit3.C)})
-    def test_with_bigger_value(self):
-        self.assertResultFalse()
-
-    @args({"other": Property(3, Unit3.C)})
-    def test_with_smaller_value(self):
-        self.assertResultTrue()
-
-    @args({"other": Property(50, Unit3.c)})
-    def test_with_other_units(self):
-        self.assert_invalid_operation()
-
-    @args({"other": Property(5, Unit3.C)})
-    def test_with_same_prop(self):
-        self.assertResultFalse()
-
-
-@add_to(property_test_suite, "__gt__")
-class TestAliasPropertyGreater(TestProperty):
-    def build_property(self):
-        return Property(10, Unit8.H)
-
-    @args({"other": Property(35, Unit1.a**2 / Unit4.d**2)})
-    def test_with_aliased_si_units(self):
-        self.assertResultTrue()
-
-    @args({"other": Property(15, Unit1.A**2 / Unit4.D**2)})
-    def test_with_aliased_units(self):
-        self.assertResultFalse()
-
-    @args({"other": Property(22, Unit6.f / Unit4.d**2)})
-    def test_with_other_aliased_si_units(self):
-        self.assertResultTrue()
-
-    @args({"other": Property(345, Unit6.F / Unit4.D**2)})
-    def test_with_other_aliased_units(self):
-        self.assertResultTrue()
-
-
-@add_to(property_test_suite, "__ge__")
-class TestPropertyGreaterEqual(TestProperty):
-
-    def build_property(self) -> Property:
-        return Property(12, Unit1.A * Unit4.D)
-
-    @args({"other": 4})
-    def test_with_numeric(self):
-        self.assert_invalid_operation()
-
-    @args({"other": Property(20, Unit1.A)})
-    def test_with_other_unit_type(self):
-        self.assert_invalid_operation()
-
-    @args({"other": Property(13 * 10 * 5, Unit1.a * Unit4.d)})
-    def test_with_other_units(self):
-        self.assertResultFalse()
-
-    @args({"other": Property(22.2, (Unit1.A * Unit4.D).inverse())})
-    def test_with_inverse_units(self):
-        self.assert_invalid_operation()
-
-    @args({"other": Property(1, Unit1.A2 * Unit4.D)})
-    def test_with_unregistered_unit(self):
-        self.assert_invalid_operation()
-
-    @args({"other": Property(12, Unit1.A * Unit4.D)})
-    def test_with_same_prop(self):
-        self.assertResultTrue()
-
-    @args({"other": Property(120, Unit1.a * Unit4.D)})
-    def test_with_other_units_same_value(self):
-        self.assertResultTrue()
-
-    @args({"other": Property(-12, Unit1.A * Unit4.D)})
-    def test_with_negative_prop(self):
-        self.assertResultTrue()
-
-    @args({"other": Property(13, Unit1.A * Unit4.D)})
-    def test_with_bigger_prop(self):
-        self.assertResultFalse()
-
-
-@add_to(property_test_suite, "__ge__")
-class TestPropertyWithUnregistedUnitsGreaterEqual(TestProperty):
-
-    def build_property(self):
-        return Property(5, Unit3.C)
-
-    @args({"other": Property(6, Unit3.C)})
-    def test_with_bigger_value(self):
-        self.assertResultFalse()
-
-    @args({"other": Property(3, Unit3.C)})
-    def test_with_smaller_value(self):
-        self.assertResultTrue()
-
-    @args({"other": Property(50, Unit3.c)})
-    def test_with_other_units(self):
-        self.assert_invalid_operation()
-
-    @args({"other": Property(5, Unit3.C)})
-    def test_with_same_prop(self):
-        self.assertResultTrue()
-
-
-@add_to(property_test_suite, "__ge__")
-class TestAliasPropertyGreaterEqual(TestProperty):
-    def build_property(self):
-        return Property(10, Unit8.H)
-
-    @args({"other": Property(40, Unit1.a**2 / Unit4.d**2)})
-    def test_with_aliased_si_units(self):
-        self.assertResultTrue()
-
-    @args({"other": Property(20, Unit1.A**2 / Unit4.D**2)})
-    def test_with_aliased_units(self):
-        self.assertResultFalse()
-
-    @args({"other": Property(40, Unit6.f / Unit4.d**2)})
-    def test_with_other_aliased_si_units(self):
-        self.assertResultTrue()
-
-    @args({"other": Property(500, Unit6.F / Unit4.D**2)})
-    def test_with_other_aliased_units(self):
-        self.assertResultTrue()
-
-
-@add_to(property_test_suite, "__lt__")
-class TestPropertyLower(TestProperty):
-
-    def build_property(self) -> Property:
-        return Property(15, Unit1.A * Unit4.D)
-
-    @args({"other": 4})
-    def test_with_numeric(self):
-        self.assert_invalid_operation()
-
-    @args({"other": Property(20, Unit1.A)})
-    def test_with_other_unit_type(self):
-        self.assert_invalid_operation()
-
-    @args({"other": Property(13 * 10 * 5, Unit1.a * Unit4.d)})
-    def test_with_other_units(self):
-        self.assertResultFalse()
-
-    @args({"other": Property(22.2, (Unit1.A * Unit4.D).inverse())})
-    def test_with_inverse_units(self):
-        self.assert_invalid_operation()
-
-    @args({"other": Property(1, Unit1.A2 * Unit4.D)})
-    def test_with_unregistered_unit(self):
-        self.assert_invalid_operation()
-
-    @args({"other": Property(15, Unit1.A * Unit4.D)})
-    def test_with_same_prop(self):
-        self.assertResultFalse()
-
-    @args({"other": Property(15 * 10, Unit1.a * Unit4.D)})
-    def test_with_other_units_same_value(self):
-        self.assertResultFalse()
-
-    @args({"other": Property(-15, Unit1.A * Unit4.D)})
-    def test_with_negative_prop(self):
-        self.assertResultFalse()
-
-    @args({"other": Property(23, Unit1.A * Unit4.D)})
-    def test_with_bigger_prop(self):
-        self.assertResultTrue()
-
-
-@add_to(property_test_suite, "__lt__")
-class TestPropertyWithUnregistedUnitsLower(TestProperty):
-
-    def build_property(self):
-        return Property(5, Unit3.C)
-
-    @args({"other": Property(6, Unit3.C)})
-    def test_with_bigger_value(self):
-        self.assertResultTrue()
-
-    @args({"other": Property(3, Unit3.C)})
-    def test_with_smaller_value(self):
-        self.assertResultFalse()
-
-    @args({"other": Property(50, Unit3.c)})
-    def test_with_other_units(self):
-        self.assert_invalid_operation()
-
-    @args({"other": Property(5, Unit3.C)})
-    def test_with_same_prop(self):
-        self.assertResultFalse()
-
-
-@add_to(property_test_suite, "__lt__")
-class TestAliasPropertyLower(TestProperty):
-    def build_property(self):
-        return Property(10, Unit8.H)
+def _build_12_A_PER_D() -> Property:
+    return Property(12, Unit1.A / Unit4.D)
+
+
+def _build_12_A_D() -> Property:
+    return Property(12, Unit1.A * Unit4.D)
+
+
+def _build_15_A_D() -> Property:
+    return Property(15, Unit1.A * Unit4.D)
+
+
+def _build_5_C() -> Property:
+    return Property(5, Unit3.C)
+
+
+def _build_10_H() -> Property:
+    return Property(10, Unit8.H)
+
+
+# (name, operator, left operand factory, right operand, expected result)
+_ORDER_CASES = [
+    ("with_numeric", gt, _build_12_A_PER_D, 4, PropertyBinaryOperationError),
+    (
+        "with_other_unit_type",
+        gt,
+        _build_12_A_PER_D,
+        Property(20, Unit1.A),
+        PropertyBinaryOperationError,
+    ),
+    (
+        "with_other_units",
+        gt,
+        _build_12_A_PER_D,
+        Property(130, Unit1.a / Unit4.D),
+        False,
+    ),
+    (
+        "with_inverse_units",
+        gt,
+        _build_12_A_PER_D,
+        Property(22.2, (Unit1.A * Unit4.D).inverse()),
+        PropertyBinaryOperationError,
+    ),
+    (
+        "with_unregistered_unit",
+        gt,
+        _build_12_A_PER_D,
+        Property(1, Unit1.A2 / Unit4.D),
+        PropertyBinaryOperationError,
+    ),
+    ("with_same_prop", gt, _build_12_A_PER_D, Property(12, Unit1.A / Unit4.D), False),
+    (
+        "with_other_units_same_value",
+        gt,
+        _build_12_A_PER_D,
+        Property(120, Unit1.a / Unit4.D),
+        False,
+    ),
+    (
+        "with_negative_prop",
+        gt,
+        _build_12_A_PER_D,
+        Property(-12, Unit1.A / Unit4.D),
+        True,
+    ),
+    ("with_bigger_prop", gt, _build_12_A_PER_D, Property(13, Unit1.A / Unit4.D), False),
+    ("unregistered_with_bigger_value", gt, _build_5_C, Property(6, Unit3.C), False),
+    ("unregistered_with_smaller_value", gt, _build_5_C, Property(3, Unit3.C), True),
+    (
+        "unregistered_with_other_units",
+        gt,
+        _build_5_C,
+        Property(50, Unit3.c),
+        PropertyBinaryOperationError,
+    ),
+    ("unregistered_with_same_prop", gt, _build_5_C, Property(5, Unit3.C), False),
+    (
+        "alias_with_aliased_si_units",
+        gt,
+        _build_10_H,
+        Property(35, Unit1.a**2 / Unit4.d**2),
+        True,
+    ),
+    (
+        "alias_with_aliased_units",
+        gt,
+        _build_10_H,
+        Property(15, Unit1.A**2 / Unit4.D**2),
+        False,
+    ),
+    (
+        "alias_with_other_aliased_si_units",
+        gt,
+        _build_10_H,
+        Property(22, Unit6.f / Unit4.d**2),
+        True,
+    ),
+    (
+        "alias_with_other_aliased_units",
+        gt,
+        _build_10_H,
+        Property(345, Unit6.F / Unit4.D**2),
+        True,
+    ),
+    ("with_numeric", ge, _build_12_A_D, 4, PropertyBinaryOperationError),
+    (
+        "with_other_unit_type",
+        ge,
+        _build_12_A_D,
+        Property(20, Unit1.A),
+        PropertyBinaryOperationError,
+    ),
+    (
+        "with_other_units",
+        ge,
+        _build_12_A_D,
+        Property(13 * 10 * 5, Unit1.a * Unit4.d),
+        False,
+    ),
+    (
+        "with_inverse_units",
+        ge,
+        _build_12_A_D,
+        Property(22.2, (Unit1.A * Unit4.D).inverse()),
+        PropertyBinaryOperationError,
+    ),
+    (
+        "with_unregistered_unit",
+        ge,
+        _build_12_A_D,
+        Property(1, Unit1.A2 * Unit4.D),
+        PropertyBinaryOperationError,
+    ),
+    ("with_same_prop", ge, _build_12_A_D, Property(12, Unit1.A * Unit4.D), True),
+    (
+        "with_other_units_same_value",
+        ge,
+        _build_12_A_D,
+        Property(120, Unit1.a * Unit4.D),
+        True,
+    ),
+    ("with_negative_prop", ge, _build_12_A_D, Property(-12, Unit1.A * Unit4.D), True),
+    ("with_bigger_prop", ge, _build_12_A_D, Property(13, Unit1.A * Unit4.D), False),
+    ("unregistered_with_bigger_value", ge, _build_5_C, Property(6, Unit3.C), False),
+    ("unregistered_with_smaller_value", ge, _build_5_C, Property(3, Unit3.C), True),
+    (
+        "unregistered_with_other_units",
+        ge,
+        _build_5_C,
+        Property(50, Unit3.c),
+        PropertyBinaryOperationError,
+    ),
+    ("unregistered_with_same_prop", ge, _build_5_C, Property(5, Unit3.C), True),
+    (
+        "alias_with_aliased_si_units",
+        ge,
+        _build_10_H,
+        Property(40, Unit1.a**2 / Unit4.d**2),
+        True,
+    ),
+    (
+        "alias_with_aliased_units",
+        ge,
+        _build_10_H,
+        Property(20, Unit1.A**2 / Unit4.D**2),
+        False,
+    ),
+    (
+        "alias_with_other_aliased_si_units",
+        ge,
+        _build_10_H,
+        Property(40, Unit6.f / Unit4.d**2),
+        True,
+    ),
+    (
+        "alias_with_other_aliased_units",
+        ge,
+        _build_10_H,
+        Property(500, Unit6.F / Unit4.D**2),
+        True,
+    ),
+    ("with_numeric", lt, _build_15_A_D, 4, PropertyBinaryOperationError),
+    (
+        "with_other_unit_type",
+        lt,
+        _build_15_A_D,
+        Property(20, Unit1.A),
+        PropertyBinaryOperationError,
+    ),
+    (
+        "with_other_units",
+        lt,
+        _build_15_A_D,
+        Property(13 * 10 * 5, Unit1.a * Unit4.d),
+        False,
+    ),
+    (
+        "with_inverse_units",
+        lt,
+        _build_15_A_D,
+        Property(22.2, (Unit1.A * Unit4.D).inverse()),
+        PropertyBinaryOperationError,
+    ),
+    (
+        "with_unregistered_unit",
+        lt,
+        _build_15_A_D,
+        Property(1, Unit1.A2 * Unit4.D),
+        PropertyBinaryOperationError,
+    ),
+    ("with_same_prop", lt, _build_15_A_D, Property(15, Unit1.A * Unit4.D), False),
+    (
+        "with_other_units_same_value",
+        lt,
+        _build_15_A_D,
+        Property(15 * 10, Unit1.a * Unit4.D),
+        False,
+    ),
+    ("with_negative_prop", lt, _build_15_A_D, Property(-15, Unit1.A * Unit4.D), False),
+    ("with_bigger_prop", lt, _build_15_A_D, Property(23, Unit1.A * Unit4.D), True),
+    ("unregistered_with_bigger_value", lt, _build_5_C, Property(6, Unit3.C), True),
+    ("unregistered_with_smaller_value", lt, _build_5_C, Property(3, Unit3.C), False),
+    (
+        "unregistered_with_other_units",
+        lt,
+        _build_5_C,
+        Property(50, Unit3.c),
+        PropertyBinaryOperationError,
+    ),
+    ("unregistered_with_same_prop", lt, _build_5_C, Property(5, Unit3.C), False),
+    (
+        "alias_with_aliased_si_units",
+        lt,
+        _build_10_H,
+        Property(50, Unit1.a**2 / Unit4.d**2),
+        True,
+    ),
+    (
+        "alias_with_aliased_units",
+        lt,
+        _build_10_H,
+        Property(11, Unit1.A**2 / Unit4.D**2),
+        True,
+    ),
+    (
+        "alias_with_other_aliased_si_units",
+        lt,
+        _build_10_H,
+        Property(20, Unit6.f / Unit4.d**2),
+        False,
+    ),
+    (
+        "alias_with_other_aliased_units",
+        lt,
+        _build_10_H,
+        Property(600, Unit6.F / Unit4.D**2),
+        True,
+    ),
+    ("with_numeric", le, _build_15_A_D, 4, PropertyBinaryOperationError),
+    (
+        "with_other_unit_type",
+        le,
+        _build_15_A_D,
+        Property(20, Unit1.A),
+        PropertyBinaryOperationError,
+    ),
+    (
+        "with_other_units",
+        le,
+        _build_15_A_D,
+        Property(13 * 10 * 5, Unit1.a * Unit4.d),
+        False,
+    ),
+    (
+        "with_inverse_units",
+        le,
+        _build_15_A_D,
+        Property(22.2, (Unit1.A * Unit4.D).inverse()),
+        PropertyBinaryOperationError,
+    ),
+    (
+        "with_unregistered_unit",
+        le,
+        _build_15_A_D,
+        Property(1, Unit1.A2 * Unit4.D),
+        PropertyBinaryOperationError,
+    ),
+    ("with_same_prop", le, _build_15_A_D, Property(15, Unit1.A * Unit4.D), True),
+    (
+        "with_other_units_same_value",
+        le,
+        _build_15_A_D,
+        Property(150, Unit1.a * Unit4.D),
+        True,
+    ),
+    ("with_negative_prop", le, _build_15_A_D, Property(-15, Unit1.A * Unit4.D), False),
+    ("with_bigger_prop", le, _build_15_A_D, Property(23, Unit1.A * Unit4.D), True),
+    ("unregistered_with_bigger_value", le, _build_5_C, Property(6, Unit3.C), True),
+    ("unregistered_with_smaller_value", le, _build_5_C, Property(3, Unit3.C), False),
+    (
+        "unregistered_with_other_units",
+        le,
+        _build_5_C,
+        Property(50, Unit3.c),
+        PropertyBinaryOperationError,
+    ),
+    ("unregistered_with_same_prop", le, _build_5_C, Property(5, Unit3.C), True),
+    (
+        "alias_with_aliased_si_units",
+        le,
+        _build_10_H,
+        Property(40, Unit1.a**2 / Unit4.d**2),
+        True,
+    ),
+    (
+        "alias_with_aliased_units",
+        le,
+        _build_10_H,
+        Property(11, Unit1.A**2 / Unit4.D**2),
+        True,
+    ),
+    (
+        "alias_with_other_aliased_si_units",
+        le,
+        _build_10_H,
+        Property(40, Unit6.f / Unit4.d**2),
+        True,
+    ),
+    (
+        "alias_with_other_aliased_units",
+        le,
+        _build_10_H,
+        Property(505, Unit6.F / Unit4.D**2),
+        True,
+    ),
+]
+
+
+class TestPropertyOrdering(TestCase):
+    """
+    Runs every case of `_ORDER_CASES` that uses the given operator as a sub test.
+    """
+
+    def assert_order_cases(self, operator) -> None:
+        assert_cases(
+            self,
+            [
+                (
+                    {"name": name, "build_property": build_property, "other": other},
+                    expected,
+                )
+                for name, op, build_property, other, expected in _ORDER_CASES
+                if op is operator
+            ],
+            lambda name, build_property, other: operator(build_property(), other),
+            self.assertIs,
+        )
+
+    def test_greater(self):
+        self.assert_order_cases(gt)
+
+    def test_greater_equal(self):
+        self.assert_order_cases(ge)
+
+    def test_lower(self):
+        self.assert_order_cases(lt)
+
+    def test_lower_equal(self):
+        self.assert_order_cases(le)
 
-    @args({"other": Property(50, Unit1.a**2 / Unit4.d**2)})
-    def test_with_aliased_si_units(self):
-        self.assertResultTrue()
 
-    @args({"other": Property(11, Unit1.A**2 / Unit4.D**2)})
-    def test_with_aliased_units(self):
-        self.assertResultTrue()
-
-    @args({"other": Property(20, Unit6.f / Unit4.d**2)})
-    def test_with_other_aliased_si_units(self):
-        self.assertResultFalse()
-
-    @args({"other": Property(600, Unit6.F / Unit4.D**2)})
-    def test_with_other_aliased_units(self):
-        self.assertResultTrue()
-
-
-@add_to(property_test_suite, "__le__")
-class TestPropertyLowerEqual(TestProperty):
-
-    def build_property(self) -> Property:
-        return Property(15, Unit1.A * Unit4.D)
-
-    @args({"other": 4})
-    def test_with_numeric(self):
-        self.assert_invalid_operation()
-
-    @args({"other": Property(20, Unit1.A)})
-    def test_with_other_unit_type(self):
-        self.assert_invalid_operation()
-
-    @args({"other": Property(13 * 10 * 5, Unit1.a * Unit4.d)})
-    def test_with_other_units(self):
-        self.assertResultFalse()
-
-    @args({"other": Property(22.2, (Unit1.A * Unit4.D).inverse())})
-    def test_with_inverse_units(self):
-        self.assert_invalid_operation()
-
-    @args({"other": Property(1, Unit1.A2 * Unit4.D)})
-    def test_with_unregistered_unit(self):
-        self.assert_invalid_operation()
-
-    @args({"other": Property(15, Unit1.A * Unit4.D)})
-    def test_with_same_prop(self):
-        self.assertResultTrue()
-
-    @args({"other": Property(150, Unit1.a * Unit4.D)})
-    def test_with_other_units_same_value(self):
-        self.assertResultTrue()
-
-    @args({"other": Property(-15, Unit1.A * Unit4.D)})
-    def test_with_negative_prop(self):
-        self.assertResultFalse()
-
-    @args({"other": Property(23, Unit1.A * Unit4.D)})
-    def test_with_bigger_prop(self):
-        self.assertResultTrue()
-
-
-@add_to(property_test_suite, "__le__")
-class TestPropertyWithUnregistedUnitsLowerEqual(TestProperty):
-
-    def build_property(self):
-        return Property(5, Unit3.C)
-
-    @args({"other": Property(6, Unit3.C)})
-    def test_with_bigger_value(self):
-        self.assertResultTrue()
-
-    @args({"other": Property(3, Unit3.C)})
-    def test_with_smaller_value(self):
-        self.assertResultFalse()
-
-    @args({"other": Property(50, Unit3.c)})
-    def test_with_other_units(self):
-        self.assert_invalid_operation()
-
-    @args({"other": Property(5, Unit3.C)})
-    def test_with_same_prop(self):
-        self.assertResultTrue()
-
-
-@add_to(property_test_suite, "__le__")
-class TestAliasPropertyLowerEqual(TestProperty):
-    def build_property(self):
-        return Property(10, Unit8.H)
-
-    @args({"other": Property(40, Unit1.a**2 / Unit4.d**2)})
-    def test_with_aliased_si_units(self):
-        self.assertResultTrue()
-
-    @args({"other": Property(11, Unit1.A**2 / Unit4.D**2)})
-    def test_with_aliased_units(self):
-        self.assertResultTrue()
-
-    @args({"other": Property(40, Unit6.f / Unit4.d**2)})
-    def test_with_other_aliased_si_units(self):
-        self.assertResultTrue()
-
-    @args({"other": Property(505, Unit6.F / Unit4.D**2)})
-    def test_with_other_aliased_units(self):
-        self.assertResultTrue()
+if __name__ == "__main__":
+    main()
@@ -1,89 +1,66 @@
-from unittest import TestSuite, TextTestRunner
+from unittest import main
 
-from unittest_extensions import TestCase, args
+from unittest_extensions import TestCase
 
-from property_utils.tests.utils import add_to, def_load_tests
+from property_utils.tests.utils import def_load_tests, assert_cases
 from property_utils.tests.data import PositiveProp, BiggerThan5Prop, Unit1, Unit2
 from property_utils.exceptions.properties.property import PropertyValidationError
-from property_utils.exceptions.base import PropertyUtilsException
 
 load_tests = def_load_tests("property_utils.properties.validated_property")
 
-validated_property_test_suite = TestSuite()
-
-
-if __name__ == "__main__":
-    runner = TextTestRunner()
-    runner.run(validated_property_test_suite)
-
 
 class TestValidatedProperty(TestCase):
-    def assert_validation_error(self, expected_regex=None):
-        self._assert_error(PropertyValidationError, expected_regex)
-
-    def assert_result(self, result_str):
-        self.assertSequenceEqual(str(self.result()), result_str, str)
-
-    def _assert_error(self, error: PropertyUtilsException, expected_regex):
-        if expected_regex is None:
-            self.assertResultRaises(error)
-        else:
-            self.assertResultRaisesRegex(error, expected_regex)
+    def assert_cases(self, cases) -> None:
+        """
+        Runs the `(kwargs, expected)` rows of `cases` against `subject` as sub tests;
+        `expected` is either the string representation of the built property or
+        `PropertyValidationError`.
+        """
+        assert_cases(self, cases, lambda **kwargs: str(self.subject(**kwargs)))
 
 
-@add_to(validated_property_test_suite)
 class TestValidatedPropertyInitWithNoUnits(TestValidatedProperty):
     def subject(self, value):
         return BiggerThan5Prop(value)
 
-    @args({"value": "1"})
-    def test_with_non_numeric(self):
-        self.assert_validation_error()
+    def test_value(self):
+        self.assert_cases(
+            [
+                ({"value": "1"}, PropertyValidationError),
+                ({"value": 2}, PropertyValidationError),
+                ({"value": None}, PropertyValidationError),
+                ({"value": 12.3}, "12.3 a"),
+            ]
+        )
 
-    @args({"value": 2})
-    def test_with_less_than_5(self):
-        self.assert_validation_error()
 
-    @args({"value": None})
-    def test_with_none(self):
-        self.assert_validation_error()
-
-    @args({"value": 12.3})
-    def test_with_bigger_than_5(self):
-        self.assert_result("12.3 a")
-
-
-@add_to(validated_property_test_suite)
 class TestValidatedPropertyInit(TestValidatedProperty):
     def subject(self, unit):
         return BiggerThan5Prop(10, unit)
 
-    @args({"unit": Unit2.B})
-    def test_with_other_unit(self):
-        self.assert_validation_error()
+    def test_unit(self):
+        self.assert_cases(
+            [
+                ({"unit": Unit2.B}, PropertyValidationError),
+                ({"unit": Unit1.A}, "10 A"),
+                ({"unit": Unit1.A**2}, PropertyValidationError),
+            ]
+        )
 
-    @args({"unit": Unit1.A})
-    def test_with_valid_unit(self):
-        self.assert_result("10 A")
 
-    @args({"unit": Unit1.A**2})
-    def test_with_invalid_dimension(self):
-        self.assert_validation_error()
-
-
-@add_to(validated_property_test_suite)
 class TestValidatedPropertyInitWithDefaultUnit(TestValidatedProperty):
     def subject(self, value, **kwargs):
         return PositiveProp(value, **kwargs)
 
-    @args({"value": -1})
-    def test_with_invalid_value(self):
-        self.assert_validation_error()
+    def test_value(self):
+        self.assert_cases(
+            [
+                ({"value": -1}, PropertyValidationError),
+                ({"value": 2}, "2 A2"),
+                ({"value": 5, "unit": Unit1.a}, "5 a"),
+            ]
+        )
 
-    @args({"value": 2})
-    def test_with_valid_value(self):
-        self.assert_result("2 A2")
 
-    @args({"value": 5, "unit": Unit1.a})
-    def test_with_unit(self):
-        self.assert_result("5 a")
+if __name__ == "__main__":
+    main()
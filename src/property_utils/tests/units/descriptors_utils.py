@@ -1,10 +1,11 @@
 from typing import Callable, Type
 from abc import abstractmethod
 
-from unittest_extensions import TestCase
+from unittest_extensions import TestCase, args
 
 from property_utils.units.descriptors import Descriptor
-from property_utils.exceptions.units.descriptors import DescriptorBinaryOperationError
+from property_utils.exceptions.units.descriptors import DescriptorExponentError
+from property_utils.tests.utils import assert_cases
 
 
 class TestDescriptor(TestCase):
@@ -16,13 +17,40 @@ class TestDescriptor(TestCase):
 
     def assert_result(self, result_str):
         self.assertResultIsInstance(self.produced_type)
-        self.assertSequenceEqual(str(self.cachedResult()), result_str, str)
+        self.assertEqual(str(self.cachedResult()), result_str)
 
-    def assert_invalid(self, expected_regex=None):
-        if expected_regex is None:
-            self.assertResultRaises(DescriptorBinaryOperationError)
+    def assert_cases(self, cases) -> None:
+        """
+        Runs the `(argument, expected)` rows of `cases` against `subject` as sub
+        tests; `expected` is either the string of the produced descriptor, the
+        boolean the subject returns or the error the subject raises.
+        """
+        assert_cases(
+            self,
+            [({"argument": argument}, expected) for argument, expected in cases],
+            lambda argument: self.subject(argument),
+            self._assert_case_result,
+        )
+
+    def _assert_case_result(self, result, expected) -> None:
+        if expected is True:
+            self.assertTrue(result)
+        elif expected is False:
+            self.assertFalse(result)
         else:
-            self.assertResultRaisesRegex(DescriptorBinaryOperationError, expected_regex)
+            self.assertIsInstance(result, self.produced_type)
+            self.assertEqual(str(result), expected)
+
+
+class ExponentiationWithNone:
+    """
+    Mixin for descriptor exponentiation test cases whose subject raises a
+    `DescriptorExponentError` when raised to the power of None.
+    """
+
+    @args({"value": None})
+    def test_with_none(self):
+        self.assertResultRaises(DescriptorExponentError)
 
 
 class TestDescriptorBinaryOperation(TestDescriptor):
@@ -1,12 +1,15 @@
-from typing import Any
-from unittest import TestSuite, TextTestRunner
+from unittest import main
 
 from unittest_extensions import TestCase, args
 
 
 from property_utils.units.converter_types import (
+    ConverterType,
     get_converter,
     register_converter,
+    _descriptor_key,
+    _cached_call,
+    _keyed_call,
 )
 from property_utils.exceptions.base import (
     PropertyUtilsTypeError,
@@ -19,7 +22,7 @@ from property_utils.exceptions.units.converter_types import (
     ConverterDependenciesError,
     UnsupportedConverterError,
 )
-from property_utils.tests.utils import add_to, def_load_tests
+from property_utils.tests.utils import def_load_tests, assert_cases
 from property_utils.tests.data import (
     Unit1,
     Unit2,
@@ -27,7 +30,6 @@ from property_utils.tests.data import (
     Unit4,
     Unit5,
     Unit6,
-    Unit7,
     Unit8,
     Unit1Converter,
     UnregisteredConverter,
@@ -44,27 +46,80 @@ from property_utils.tests.data import (
     Unit5Converter,
     Unit1Unit4_2Converter,
     Unit6Unit4_2Converter,
+    UnhashableDimension,
 )
 
 
 load_tests = def_load_tests("property_utils.units.converter_types")
 
 
-converter_types_test_suite = TestSuite()
-
-converter_types_test_suite.addTests(
-    [
-        (GetConverter_test_suite := TestSuite()),
-        (RegisterConverter_test_suite := TestSuite()),
-        (AbsoluteUnitConverter_test_suite := TestSuite()),
-        (RelativeUnitConverter_test_suite := TestSuite()),
-        (ExponentiatedUnitConverter_test_suite := TestSuite()),
-        (CompositeUnitConverter_test_suite := TestSuite()),
-    ]
-)
+# Unit descriptors shared by the `args` of several test cases.
+_U_A2 = Unit1.A**2
+_U_A2_PER_D3 = Unit1.A**2 / Unit4.D**3
+_U_A314 = Unit1.A**3.14
+_U_A4 = Unit1.A**4
+_U_A_B = Unit1.A * Unit2.B
+_U_A_C = Unit1.A * Unit3.C
+_U_A_D = Unit1.A * Unit4.D
+_U_A_PER_D = Unit1.A / Unit4.D
+_U_A_PER_D2 = Unit1.A / (Unit4.D**2)
+_U_A_UNIT4_D2 = Unit1.A * Unit4.D2
+_U_B2 = Unit2.B**2
+_U_B314 = Unit2.B**3.14
+_U_B4 = Unit2.B**4
+_U_C2 = Unit3.C**2
+_U_C_A = Unit3.C * Unit1.A
+_U_C_B = Unit3.C * Unit2.B
+_U_D_A = Unit4.D * Unit1.A
+_U_F_PER_D2 = Unit6.F / (Unit4.D**2)
+_U_UNIT1_A2_314 = Unit1.A2**3.14
+_U_UNIT1_A2_D = Unit1.A2 * Unit4.D
+_U_a2 = Unit1.a**2
+_U_a314 = Unit1.a**3.14
+_U_a_PER_d = Unit1.a / Unit4.d
+_U_a_PER_d2 = Unit1.a / (Unit4.d**2)
+_U_a_b = Unit1.a * Unit2.b
+_U_a_c = Unit1.a * Unit3.c
+_U_a_d = Unit1.a * Unit4.d
+_U_b4 = Unit2.b**4
+_U_c2 = Unit3.c**2
+_U_f_PER_d2 = Unit6.f / (Unit4.d**2)
+
+
+class TestConverter(TestCase):
+    """
+    Calls the `_method` of `converter` with the arguments of the test as subject.
+    """
+
+    converter: ConverterType
+    _method: str
+
+    def subject(self, **kwargs):
+        return getattr(self.converter, self._method)(**kwargs)
+
+    def assert_cases(self, cases) -> None:
+        """
+        Runs the `(value, from_descriptor, to_descriptor, expected)` rows of `cases`
+        against `subject` as sub tests; `expected` is either the converted value or
+        the error the conversion raises.
+        """
+        assert_cases(
+            self,
+            [
+                (
+                    {
+                        "value": value,
+                        "from_descriptor": from_descriptor,
+                        "to_descriptor": to_descriptor,
+                    },
+                    expected,
+                )
+                for value, from_descriptor, to_descriptor, expected in cases
+            ],
+            self.subject,
+        )
 
 
-@add_to(GetConverter_test_suite)
 class TestGetConverter(TestCase):
     def subject(self, generic):
         return get_converter(generic)
@@ -94,7 +149,6 @@ class TestGetConverter(TestCase):
         self.assertResult(Unit1Unit4Converter)
 
 
-@add_to(GetConverter_test_suite)
 class TestGetUnregisteredDimensionConverter(TestCase):
     def subject(self, generic):
         return get_converter(generic)
@@ -114,7 +168,6 @@ class TestGetUnregisteredDimensionConverter(TestCase):
         self.assert_convert(10 * (10**2.45), Unit1.A**2.45, Unit1.a**2.45)
 
 
-@add_to(RegisterConverter_test_suite)
 class TestRegisterConverter(TestCase):
     def subject(self, generic):
         return register_converter(generic)(UnregisteredConverter)
@@ -133,50 +186,33 @@ class TestRegisterConverter(TestCase):
         self.assertEqual(self.cachedResult().generic_unit_descriptor, Unit3)
 
 
-@add_to(AbsoluteUnitConverter_test_suite)
-class TestAbsoluteUnitConverterConvert(TestCase):
-    def subject(self, value, from_descriptor, to_descriptor):
-        return Unit1Converter.convert(value, from_descriptor, to_descriptor)
-
-    @args({"value": "12.34", "from_descriptor": Unit1.A, "to_descriptor": Unit1.a})
-    def test_with_invalid_value(self):
-        self.assertResultRaises(UnitConversionError)
-
-    @args({"value": 10, "from_descriptor": Unit2.B, "to_descriptor": Unit1.A})
-    def test_with_invalid_from_descriptor(self):
-        self.assertResultRaises(UnitConversionError)
-
-    @args({"value": 2, "from_descriptor": Unit1.A, "to_descriptor": Unit2.b})
-    def test_with_invalid_to_descriptor(self):
-        self.assertResultRaises(UnitConversionError)
-
-    @args({"value": 5, "from_descriptor": Unit1.A2, "to_descriptor": Unit1.A})
-    def test_with_unregistered_from_descriptor(self):
-        self.assertResultRaises(UnitConversionError)
-
-    @args({"value": 9, "from_descriptor": Unit1.A, "to_descriptor": Unit1.A2})
-    def test_with_unregistered_to_descriptor(self):
-        self.assertResultRaises(UnitConversionError)
-
-    @args({"value": 10.1, "from_descriptor": Unit1.A, "to_descriptor": Unit1.a})
-    def test_valid_conversion_from_A_to_a(self):
-        self.assertResult(101)
-
-    @args({"value": 200, "from_descriptor": Unit1.a, "to_descriptor": Unit1.A})
-    def test_valid_conversion_from_a_to_A(self):
-        self.assertResult(20)
+class TestAbsoluteUnitConverterConvert(TestConverter):
+    converter = Unit1Converter
+    _method = "convert"
+
+    def test_convert(self):
+        self.assert_cases(
+            [
+                ("12.34", Unit1.A, Unit1.a, UnitConversionError),
+                (10, Unit2.B, Unit1.A, UnitConversionError),
+                (2, Unit1.A, Unit2.b, UnitConversionError),
+                (5, Unit1.A2, Unit1.A, UnitConversionError),
+                (9, Unit1.A, Unit1.A2, UnitConversionError),
+                (10.1, Unit1.A, Unit1.a, 101),
+                (200, Unit1.a, Unit1.A, 20),
+            ]
+        )
 
 
-@add_to(AbsoluteUnitConverter_test_suite)
-class TestAbsoluteUnitConverterAliasMeasurementUnitConvert(TestCase):
-    def subject(self, value, from_descriptor, to_descriptor) -> Any:
-        return Unit5Converter.convert(value, from_descriptor, to_descriptor)
+class TestAbsoluteUnitConverterAliasMeasurementUnitConvert(TestConverter):
+    converter = Unit5Converter
+    _method = "convert"
 
     @args(
         {
             "value": 5,
             "from_descriptor": Unit5.e,
-            "to_descriptor": Unit1.a / (Unit4.d**2),
+            "to_descriptor": _U_a_PER_d2,
         }
     )
     def test_with_si_aliased_units(self):
@@ -186,7 +222,7 @@ class TestAbsoluteUnitConverterAliasMeasurementUnitConvert(TestCase):
         {
             "value": 5,
             "from_descriptor": Unit5.E,
-            "to_descriptor": Unit1.A / (Unit4.D**2),
+            "to_descriptor": _U_A_PER_D2,
         }
     )
     def test_with_aliased_unit(self):
@@ -201,16 +237,15 @@ class TestAbsoluteUnitConverterAliasMeasurementUnitConvert(TestCase):
         self.assertResult(10)
 
 
-@add_to(AbsoluteUnitConverter_test_suite)
-class TestAbsoluteUnitConverterAliasMeasurementUnitGetFactor(TestCase):
-    def subject(self, from_descriptor, to_descriptor) -> Any:
-        return Unit5Converter.get_factor(from_descriptor, to_descriptor)
+class TestAbsoluteUnitConverterAliasMeasurementUnitGetFactor(TestConverter):
+    converter = Unit5Converter
+    _method = "get_factor"
 
-    @args({"from_descriptor": Unit5.e, "to_descriptor": Unit1.a / (Unit4.d**2)})
+    @args({"from_descriptor": Unit5.e, "to_descriptor": _U_a_PER_d2})
     def test_with_si_aliased_units(self):
         self.assertResult(1)
 
-    @args({"from_descriptor": Unit5.E, "to_descriptor": Unit1.A / (Unit4.D**2)})
+    @args({"from_descriptor": Unit5.E, "to_descriptor": _U_A_PER_D2})
     def test_with_aliased_unit(self):
         self.assertResultAlmost(15 * 25 / 10, places=1)
 
@@ -223,10 +258,9 @@ class TestAbsoluteUnitConverterAliasMeasurementUnitGetFactor(TestCase):
         self.assertResult(1)
 
 
-@add_to(AbsoluteUnitConverter_test_suite)
-class TestAbsoluteUnitConverterGetFactor(TestCase):
-    def subject(self, from_descriptor, to_descriptor):
-        return Unit1Converter.get_factor(from_descriptor, to_descriptor)
+class TestAbsoluteUnitConverterGetFactor(TestConverter):
+    converter = Unit1Converter
+    _method = "get_factor"
 
     @args({"from_descriptor": Unit2.B, "to_descriptor": Unit1.A})
     def test_with_invalid_from_descriptor(self):
@@ -252,235 +286,193 @@ class TestAbsoluteUnitConverterGetFactor(TestCase):
     def test_from_a_to_A(self):
         self.assertResult(0.1)
 
+    @args({"from_descriptor": Unit1.a, "to_descriptor": Unit1.a})
+    def test_with_same_units(self):
+        self.assertResult(1)
 
-@add_to(RelativeUnitConverter_test_suite)
-class TestRelativeUnitConverterConvert(TestCase):
-    def subject(self, value, from_descriptor, to_descriptor):
-        return Unit2Converter.convert(value, from_descriptor, to_descriptor)
-
-    @args({"value": "0.98", "from_descriptor": Unit2.B, "to_descriptor": Unit2.B})
-    def test_with_invalid_value(self):
-        self.assertResultRaises(UnitConversionError)
-
-    @args({"value": 12, "from_descriptor": Unit1.A, "to_descriptor": Unit2.B})
-    def test_with_invalid_from_descriptor(self):
-        self.assertResultRaises(UnitConversionError)
-
-    @args({"value": 9, "from_descriptor": Unit2.B, "to_descriptor": Unit1.A})
-    def test_with_invalid_to_descriptor(self):
-        self.assertResultRaises(UnitConversionError)
-
-    @args({"value": 5, "from_descriptor": Unit2.B2, "to_descriptor": Unit2.B})
-    def test_with_unregistered_from_descriptor(self):
-        self.assertResultRaises(UnitConversionError)
-
-    @args({"value": 4, "from_descriptor": Unit2.B, "to_descriptor": Unit2.B2})
-    def test_with_unregistered_to_descriptor(self):
-        self.assertResultRaises(UnitConversionError)
-
-    @args({"value": 10, "from_descriptor": Unit2.B3, "to_descriptor": Unit2.B})
-    def test_from_descriptor_with_erroneous_conversion_function(self):
-        self.assertResultRaises(ConversionFunctionError)
-
-    @args({"value": 0, "from_descriptor": Unit2.B, "to_descriptor": Unit2.B3})
-    def test_to_descriptor_with_erroneous_conversion_function(self):
-        self.assertResultRaises(ConversionFunctionError)
-
-    @args({"value": 10, "from_descriptor": Unit2.B, "to_descriptor": Unit2.b})
-    def test_from_B_to_b(self):
-        self.assertResult(3.5)
-
-    @args({"value": 10, "from_descriptor": Unit2.b, "to_descriptor": Unit2.B})
-    def test_from_b_to_B(self):
-        self.assertResult(23)
-
-
-@add_to(ExponentiatedUnitConverter_test_suite)
-class TestExponentiatedUnitConverterConvert(TestCase):
-    def subject(self, value, from_descriptor, to_descriptor):
-        return Unit1_314Converter.convert(value, from_descriptor, to_descriptor)
-
-    @args(
-        {"value": "1", "from_descriptor": Unit1.A**3.14, "to_descriptor": Unit1.A**3.14}
-    )
-    def test_with_invalid_value(self):
-        self.assertResultRaises(UnitConversionError)
-
-    @args({"value": 9, "from_descriptor": Unit1.A**2, "to_descriptor": Unit1.A**3.14})
-    def test_with_invalid_from_descriptor(self):
-        self.assertResultRaises(UnitConversionError)
-
-    @args({"value": 2, "from_descriptor": Unit1.A**3.14, "to_descriptor": Unit1.A})
-    def test_with_invalid_to_descriptor(self):
-        self.assertResultRaises(UnitConversionError)
-
-    @args(
-        {"value": -1, "from_descriptor": Unit1.A2**3.14, "to_descriptor": Unit1.A**3.14}
-    )
-    def test_with_unregistered_from_descriptor(self):
-        self.assertResultRaises(UnitConversionError)
+    @args({"from_descriptor": Unit1.A2, "to_descriptor": Unit1.A2})
+    def test_with_same_unregistered_units(self):
+        self.assertResultRaises(UnitConversionError)
+
+
+class TestRelativeUnitConverterConvert(TestConverter):
+    converter = Unit2Converter
+    _method = "convert"
+
+    def test_convert(self):
+        self.assert_cases(
+            [
+                ("0.98", Unit2.B, Unit2.B, UnitConversionError),
+                (12, Unit1.A, Unit2.B, UnitConversionError),
+                (9, Unit2.B, Unit1.A, UnitConversionError),
+                (5, Unit2.B2, Unit2.B, UnitConversionError),
+                (4, Unit2.B, Unit2.B2, UnitConversionError),
+                (10, Unit2.B3, Unit2.B, ConversionFunctionError),
+                (0, Unit2.B, Unit2.B3, ConversionFunctionError),
+                (10, Unit2.B, Unit2.b, 3.5),
+                (10, Unit2.b, Unit2.B, 23),
+                (10, Unit2.B3, Unit2.B3, 10),
+                (4, Unit2.B2, Unit2.B2, UnitConversionError),
+            ]
+        )
 
-    @args(
-        {"value": 5, "from_descriptor": Unit1.A**3.14, "to_descriptor": Unit1.A2**3.14}
-    )
-    def test_with_unregistered_to_descriptor(self):
-        self.assertResultRaises(UnitConversionError)
 
-    @args(
-        {"value": 7, "from_descriptor": Unit1.A**3.14, "to_descriptor": Unit1.a**3.14}
-    )
-    def test_valid_conversion_from_A314_to_a314(self):
-        self.assertResult(7 * (10**3.14))
+class TestExponentiatedUnitConverterConvert(TestConverter):
+    converter = Unit1_314Converter
+    _method = "convert"
+
+    def test_convert(self):
+        self.assert_cases(
+            [
+                ("1", _U_A314, _U_A314, UnitConversionError),
+                (9, _U_A2, _U_A314, UnitConversionError),
+                (2, _U_A314, Unit1.A, UnitConversionError),
+                (-1, _U_UNIT1_A2_314, _U_A314, UnitConversionError),
+                (5, _U_A314, _U_UNIT1_A2_314, UnitConversionError),
+                (7, _U_A314, _U_a314, 7 * (10**3.14)),
+            ]
+        )
 
-    @args(
-        {"value": 3, "from_descriptor": Unit1.a**3.14, "to_descriptor": Unit1.A**3.14}
-    )
+    @args({"value": 3, "from_descriptor": _U_a314, "to_descriptor": _U_A314})
     def test_valid_conversion_from_a314_to_A314(self):
         self.assertResultAlmost(3 * (10 ** (-3.14)), 3)
 
 
-@add_to(ExponentiatedUnitConverter_test_suite)
-class TestExponentiatedUnitConverterWithMissingDependenciesConvert(TestCase):
-    def subject(self, value, from_descriptor, to_descriptor):
-        return Unit3_2Converter.convert(value, from_descriptor, to_descriptor)
+class TestExponentiatedUnitConverterWithMissingDependenciesConvert(TestConverter):
+    converter = Unit3_2Converter
+    _method = "convert"
 
-    @args({"value": "abs", "from_descriptor": Unit3.C**2, "to_descriptor": Unit3.c**2})
+    @args({"value": "abs", "from_descriptor": _U_C2, "to_descriptor": _U_c2})
     def test_with_invalid_value(self):
         self.assertResultRaises(UnitConversionError)
 
-    @args({"value": 45, "from_descriptor": Unit2.B**2, "to_descriptor": Unit3.C**2})
+    @args({"value": 45, "from_descriptor": _U_B2, "to_descriptor": _U_C2})
     def test_with_invalid_from_descriptor(self):
         self.assertResultRaises(UnitConversionError)
 
-    @args({"value": 12, "from_descriptor": Unit3.c**2, "to_descriptor": Unit2.B**2})
+    @args({"value": 12, "from_descriptor": _U_c2, "to_descriptor": _U_B2})
     def test_with_invalid_to_descriptor(self):
         self.assertResultRaises(UnitConversionError)
 
-    @args({"value": 5, "from_descriptor": Unit3.C**2, "to_descriptor": Unit3.c**2})
+    @args({"value": 5, "from_descriptor": _U_C2, "to_descriptor": _U_c2})
     def test_from_C_to_c(self):
         self.assertResultRaises(ConverterDependenciesError)
 
 
-@add_to(ExponentiatedUnitConverter_test_suite)
-class TestUnsupportedExponentiatedUnitConverterConvert(TestCase):
-    def subject(self, value, from_descriptor, to_descriptor):
-        return Unit2_4Converter.convert(value, from_descriptor, to_descriptor)
+class TestUnsupportedExponentiatedUnitConverterConvert(TestConverter):
+    converter = Unit2_4Converter
+    _method = "convert"
 
-    @args({"value": "plk", "from_descriptor": Unit2.B**4, "to_descriptor": Unit2.b**4})
+    @args({"value": "plk", "from_descriptor": _U_B4, "to_descriptor": _U_b4})
     def test_with_invalid_value(self):
         self.assertResultRaises(UnitConversionError)
 
-    @args({"value": 15, "from_descriptor": Unit1.A**4, "to_descriptor": Unit2.b**4})
+    @args({"value": 15, "from_descriptor": _U_A4, "to_descriptor": _U_b4})
     def test_with_invalid_from_descriptor(self):
         self.assertResultRaises(UnitConversionError)
 
-    @args({"value": 4, "from_descriptor": Unit2.B**4, "to_descriptor": Unit1.A**4})
+    @args({"value": 4, "from_descriptor": _U_B4, "to_descriptor": _U_A4})
     def test_with_invalid_to_descriptor(self):
         self.assertResultRaises(UnitConversionError)
 
-    @args({"value": 6, "from_descriptor": Unit2.B**4, "to_descriptor": Unit2.b**4})
+    @args({"value": 6, "from_descriptor": _U_B4, "to_descriptor": _U_b4})
     def test_from_B_to_b(self):
         self.assertResultRaises(UnsupportedConverterError)
 
 
-@add_to(ExponentiatedUnitConverter_test_suite)
-class TestAliasExponentiatedUnitConverterConvert(TestCase):
-    def subject(self, value, from_descriptor, to_descriptor):
-        return Unit1_2Converter.convert(value, from_descriptor, to_descriptor)
+class TestAliasExponentiatedUnitConverterConvert(TestConverter):
+    converter = Unit1_2Converter
+    _method = "convert"
 
-    @args({"value": 2, "from_descriptor": Unit1.A**2, "to_descriptor": Unit1.A**2})
+    @args({"value": 2, "from_descriptor": _U_A2, "to_descriptor": _U_A2})
     def test_with_same_unit(self):
         self.assertResult(2)
 
-    @args({"value": 5, "from_descriptor": Unit1.A**2, "to_descriptor": Unit1.a**2})
+    @args({"value": 5, "from_descriptor": _U_A2, "to_descriptor": _U_a2})
     def test_with_same_unit_type(self):
         self.assertResult(500)
 
-    @args({"value": 5, "from_descriptor": Unit1.A**2, "to_descriptor": Unit6.F})
+    @args({"value": 5, "from_descriptor": _U_A2, "to_descriptor": Unit6.F})
     def test_with_alias_units(self):
         self.assertResult(250)
 
-    @args({"value": 10, "from_descriptor": Unit1.a**2, "to_descriptor": Unit6.f})
+    @args({"value": 10, "from_descriptor": _U_a2, "to_descriptor": Unit6.f})
     def test_with_alias_si_units(self):
         self.assertResult(10)
 
 
-@add_to(ExponentiatedUnitConverter_test_suite)
-class TestExponentiatedUnitConverterGetFactor(TestCase):
-    def subject(self, from_descriptor, to_descriptor):
-        return Unit1_314Converter.get_factor(from_descriptor, to_descriptor)
+class TestExponentiatedUnitConverterGetFactor(TestConverter):
+    converter = Unit1_314Converter
+    _method = "get_factor"
 
-    @args({"from_descriptor": Unit2.B**3.14, "to_descriptor": Unit1.A**3.14})
+    @args({"from_descriptor": _U_B314, "to_descriptor": _U_A314})
     def test_with_invalid_from_descriptor(self):
         self.assertResultRaises(UnitConversionError)
 
-    @args({"from_descriptor": Unit1.a**3.14, "to_descriptor": Unit2.B**3.14})
+    @args({"from_descriptor": _U_a314, "to_descriptor": _U_B314})
     def test_with_invalid_to_descriptor(self):
         self.assertResultRaises(UnitConversionError)
 
-    @args({"from_descriptor": Unit1.A2**3.14, "to_descriptor": Unit1.A**3.14})
+    @args({"from_descriptor": _U_UNIT1_A2_314, "to_descriptor": _U_A314})
     def test_with_unregistered_from_descriptor(self):
         self.assertResultRaises(UnitConversionError)
 
-    @args({"from_descriptor": Unit1.A**3.14, "to_descriptor": Unit1.A2**3.14})
+    @args({"from_descriptor": _U_A314, "to_descriptor": _U_UNIT1_A2_314})
     def test_with_unregistered_to_descriptor(self):
         self.assertResultRaises(UnitConversionError)
 
-    @args({"from_descriptor": Unit1.A**3.14, "to_descriptor": Unit1.a**3.14})
+    @args({"from_descriptor": _U_A314, "to_descriptor": _U_a314})
     def test_from_A_to_a(self):
         self.assertResult(10**3.14)
 
-    @args({"from_descriptor": Unit1.a**3.14, "to_descriptor": Unit1.A**3.14})
+    @args({"from_descriptor": _U_a314, "to_descriptor": _U_A314})
     def test_from_a_to_A(self):
         self.assertResultAlmost(10 ** (-3.14), 3)
 
 
-@add_to(ExponentiatedUnitConverter_test_suite)
-class TestExponentiatedUnitConverterWithMissingDependenciesGetFactor(TestCase):
-    def subject(self, from_descriptor, to_descriptor):
-        return Unit3_2Converter.get_factor(from_descriptor, to_descriptor)
+class TestExponentiatedUnitConverterWithMissingDependenciesGetFactor(TestConverter):
+    converter = Unit3_2Converter
+    _method = "get_factor"
 
-    @args({"from_descriptor": Unit2.B**2, "to_descriptor": Unit3.C**2})
+    @args({"from_descriptor": _U_B2, "to_descriptor": _U_C2})
     def test_with_invalid_from_descriptor(self):
         self.assertResultRaises(UnitConversionError)
 
-    @args({"from_descriptor": Unit3.c**2, "to_descriptor": Unit2.B**2})
+    @args({"from_descriptor": _U_c2, "to_descriptor": _U_B2})
     def test_with_invalid_to_descriptor(self):
         self.assertResultRaises(UnitConversionError)
 
-    @args({"from_descriptor": Unit3.C**2, "to_descriptor": Unit3.c**2})
+    @args({"from_descriptor": _U_C2, "to_descriptor": _U_c2})
     def test_from_C_to_c(self):
         self.assertResultRaises(ConverterDependenciesError)
 
 
-@add_to(ExponentiatedUnitConverter_test_suite)
-class TestUnsupportedExponentiatedUnitConverterGetFactor(TestCase):
-    def subject(self, from_descriptor, to_descriptor):
-        return Unit2_4Converter.get_factor(from_descriptor, to_descriptor)
+class TestUnsupportedExponentiatedUnitConverterGetFactor(TestConverter):
+    converter = Unit2_4Converter
+    _method = "get_factor"
 
-    @args({"from_descriptor": Unit1.A**4, "to_descriptor": Unit2.b**4})
+    @args({"from_descriptor": _U_A4, "to_descriptor": _U_b4})
     def test_with_invalid_from_descriptor(self):
         self.assertResultRaises(UnitConversionError)
 
-    @args({"from_descriptor": Unit2.B**4, "to_descriptor": Unit1.A**4})
+    @args({"from_descriptor": _U_B4, "to_descriptor": _U_A4})
     def test_with_invalid_to_descriptor(self):
         self.assertResultRaises(UnitConversionError)
 
-    @args({"from_descriptor": Unit2.B**4, "to_descriptor": Unit2.b**4})
+    @args({"from_descriptor": _U_B4, "to_descriptor": _U_b4})
     def test_from_B_to_b(self):
         self.assertResultRaises(UnsupportedConverterError)
 
 
-@add_to(CompositeUnitConverter_test_suite)
-class TestCompositeUnitConverterConvert(TestCase):
-    def subject(self, value, from_descriptor, to_descriptor):
-        return Unit1Unit4Converter.convert(value, from_descriptor, to_descriptor)
+class TestCompositeUnitConverterConvert(TestConverter):
+    converter = Unit1Unit4Converter
+    _method = "convert"
 
     @args(
         {
             "value": "0.1",
-            "from_descriptor": Unit1.A * Unit2.B,
-            "to_descriptor": Unit1.a * Unit4.d,
+            "from_descriptor": _U_A_B,
+            "to_descriptor": _U_a_d,
         }
     )
     def test_with_invalid_value(self):
@@ -489,8 +481,8 @@ class TestCompositeUnitConverterConvert(TestCase):
     @args(
         {
             "value": 1,
-            "from_descriptor": Unit3.C * Unit2.B,
-            "to_descriptor": Unit1.A * Unit4.D,
+            "from_descriptor": _U_C_B,
+            "to_descriptor": _U_A_D,
         }
     )
     def test_with_invalid_from_descriptor(self):
@@ -499,8 +491,8 @@ class TestCompositeUnitConverterConvert(TestCase):
     @args(
         {
             "value": 7,
-            "from_descriptor": Unit1.A * Unit4.D,
-            "to_descriptor": Unit3.C * Unit1.A,
+            "from_descriptor": _U_A_D,
+            "to_descriptor": _U_C_A,
         }
     )
     def test_with_invalid_to_descriptor(self):
@@ -509,8 +501,8 @@ class TestCompositeUnitConverterConvert(TestCase):
     @args(
         {
             "value": 6,
-            "from_descriptor": Unit1.A2 * Unit4.D,
-            "to_descriptor": Unit1.A * Unit4.D,
+            "from_descriptor": _U_UNIT1_A2_D,
+            "to_descriptor": _U_A_D,
         }
     )
     def test_with_unregistered_from_descriptor(self):
@@ -519,8 +511,8 @@ class TestCompositeUnitConverterConvert(TestCase):
     @args(
         {
             "value": 2,
-            "from_descriptor": Unit1.A * Unit4.D,
-            "to_descriptor": Unit1.A * Unit4.D2,
+            "from_descriptor": _U_A_D,
+            "to_descriptor": _U_A_UNIT4_D2,
         }
     )
     def test_with_unregistered_to_descriptor(self):
@@ -529,8 +521,8 @@ class TestCompositeUnitConverterConvert(TestCase):
     @args(
         {
             "value": 5,
-            "from_descriptor": Unit1.A * Unit4.D,
-            "to_descriptor": Unit1.a * Unit4.d,
+            "from_descriptor": _U_A_D,
+            "to_descriptor": _U_a_d,
         }
     )
     def test_valid_conversion_from_AD_to_ad(self):
@@ -539,8 +531,8 @@ class TestCompositeUnitConverterConvert(TestCase):
     @args(
         {
             "value": 100,
-            "from_descriptor": Unit1.a * Unit4.d,
-            "to_descriptor": Unit1.A * Unit4.D,
+            "from_descriptor": _U_a_d,
+            "to_descriptor": _U_A_D,
         }
     )
     def test_valid_conversion_from_ad_to_AD(self):
@@ -549,24 +541,23 @@ class TestCompositeUnitConverterConvert(TestCase):
     @args(
         {
             "value": 15,
-            "from_descriptor": Unit1.A * Unit4.D,
-            "to_descriptor": Unit4.D * Unit1.A,
+            "from_descriptor": _U_A_D,
+            "to_descriptor": _U_D_A,
         }
     )
     def test_from_AD_to_DA(self):
         self.assertResult(15)
 
 
-@add_to(CompositeUnitConverter_test_suite)
-class TestCompositeUnitConverterWithMissingDependenciesConvert(TestCase):
-    def subject(self, value, from_descriptor, to_descriptor):
-        return Unit1Unit3Converter.convert(value, from_descriptor, to_descriptor)
+class TestCompositeUnitConverterWithMissingDependenciesConvert(TestConverter):
+    converter = Unit1Unit3Converter
+    _method = "convert"
 
     @args(
         {
             "value": "0.1",
-            "from_descriptor": Unit1.A * Unit3.C,
-            "to_descriptor": Unit1.a * Unit3.c,
+            "from_descriptor": _U_A_C,
+            "to_descriptor": _U_a_c,
         }
     )
     def test_with_invalid_value(self):
@@ -575,8 +566,8 @@ class TestCompositeUnitConverterWithMissingDependenciesConvert(TestCase):
     @args(
         {
             "value": 1,
-            "from_descriptor": Unit1.A * Unit2.B,
-            "to_descriptor": Unit1.A * Unit3.C,
+            "from_descriptor": _U_A_B,
+            "to_descriptor": _U_A_C,
         }
     )
     def test_with_invalid_from_descriptor(self):
@@ -585,8 +576,8 @@ class TestCompositeUnitConverterWithMissingDependenciesConvert(TestCase):
     @args(
         {
             "value": 7,
-            "from_descriptor": Unit1.A * Unit3.C,
-            "to_descriptor": Unit1.A * Unit2.B,
+            "from_descriptor": _U_A_C,
+            "to_descriptor": _U_A_B,
         }
     )
     def test_with_invalid_to_descriptor(self):
@@ -595,24 +586,23 @@ class TestCompositeUnitConverterWithMissingDependenciesConvert(TestCase):
     @args(
         {
             "value": 1,
-            "from_descriptor": Unit1.A * Unit3.C,
-            "to_descriptor": Unit1.a * Unit3.c,
+            "from_descriptor": _U_A_C,
+            "to_descriptor": _U_a_c,
         }
     )
     def test_from_AC_to_ac(self):
         self.assertResultRaises(ConverterDependenciesError)
 
 
-@add_to(CompositeUnitConverter_test_suite)
-class TestUnsupportedCompositeUnitConverterConvert(TestCase):
-    def subject(self, value, from_descriptor, to_descriptor):
-        return Unit1Unit2Converter.convert(value, from_descriptor, to_descriptor)
+class TestUnsupportedCompositeUnitConverterConvert(TestConverter):
+    converter = Unit1Unit2Converter
+    _method = "convert"
 
     @args(
         {
             "value": "0.1",
-            "from_descriptor": Unit1.A * Unit2.B,
-            "to_descriptor": Unit1.a * Unit2.b,
+            "from_descriptor": _U_A_B,
+            "to_descriptor": _U_a_b,
         }
     )
     def test_with_invalid_value(self):
@@ -621,8 +611,8 @@ class TestUnsupportedCompositeUnitConverterConvert(TestCase):
     @args(
         {
             "value": 1,
-            "from_descriptor": Unit1.A * Unit3.C,
-            "to_descriptor": Unit1.A * Unit2.B,
+            "from_descriptor": _U_A_C,
+            "to_descriptor": _U_A_B,
         }
     )
     def test_with_invalid_from_descriptor(self):
@@ -631,8 +621,8 @@ class TestUnsupportedCompositeUnitConverterConvert(TestCase):
     @args(
         {
             "value": 7,
-            "from_descriptor": Unit1.A * Unit2.B,
-            "to_descriptor": Unit1.A * Unit3.C,
+            "from_descriptor": _U_A_B,
+            "to_descriptor": _U_A_C,
         }
     )
     def test_with_invalid_to_descriptor(self):
@@ -641,26 +631,23 @@ class TestUnsupportedCompositeUnitConverterConvert(TestCase):
     @args(
         {
             "value": 1,
-            "from_descriptor": Unit1.A * Unit2.B,
-            "to_descriptor": Unit1.a * Unit2.b,
+            "from_descriptor": _U_A_B,
+            "to_descriptor": _U_a_b,
         }
     )
     def test_from_AB_to_ab(self):
         self.assertResultRaises(UnsupportedConverterError)
 
 
-@add_to(CompositeUnitConverter_test_suite)
-class TestFractionCompositeConverterConvert(TestCase):
-    def subject(self, value, from_descriptor, to_descriptor):
-        return Unit1Unit4FractionConverter.convert(
-            value, from_descriptor, to_descriptor
-        )
+class TestFractionCompositeConverterConvert(TestConverter):
+    converter = Unit1Unit4FractionConverter
+    _method = "convert"
 
     @args(
         {
             "value": 25,
-            "from_descriptor": Unit1.A / Unit4.D,
-            "to_descriptor": Unit1.a / Unit4.d,
+            "from_descriptor": _U_A_PER_D,
+            "to_descriptor": _U_a_PER_d,
         }
     )
     def test_valid_conversion_from_AD_to_ad(self):
@@ -669,23 +656,22 @@ class TestFractionCompositeConverterConvert(TestCase):
     @args(
         {
             "value": 20,
-            "from_descriptor": Unit1.a / Unit4.d,
-            "to_descriptor": Unit1.A / Unit4.D,
+            "from_descriptor": _U_a_PER_d,
+            "to_descriptor": _U_A_PER_D,
         }
     )
     def test_valid_conversion_from_ad_to_AD(self):
         self.assertResult(10)
 
 
-@add_to(CompositeUnitConverter_test_suite)
-class TestComplexCompositeConverterConvert(TestCase):
-    def subject(self, value, from_descriptor, to_descriptor):
-        return Unit1_2Unit4_3Converter.convert(value, from_descriptor, to_descriptor)
+class TestComplexCompositeConverterConvert(TestConverter):
+    converter = Unit1_2Unit4_3Converter
+    _method = "convert"
 
     @args(
         {
             "value": 10,
-            "from_descriptor": (Unit1.A**2 / Unit4.D**3),
+            "from_descriptor": _U_A2_PER_D3,
             "to_descriptor": (Unit1.a**2 / Unit4.d**3),
         }
     )
@@ -695,7 +681,7 @@ class TestComplexCompositeConverterConvert(TestCase):
     @args(
         {
             "value": 10,
-            "from_descriptor": (Unit1.A**2 / Unit4.D**3),
+            "from_descriptor": _U_A2_PER_D3,
             "to_descriptor": (Unit1.a**2 / Unit4.D**3),
         }
     )
@@ -705,7 +691,7 @@ class TestComplexCompositeConverterConvert(TestCase):
     @args(
         {
             "value": 10,
-            "from_descriptor": (Unit1.A**2 / Unit4.D**3),
+            "from_descriptor": _U_A2_PER_D3,
             "to_descriptor": (Unit1.A**2 / Unit4.d**3),
         }
     )
@@ -713,16 +699,15 @@ class TestComplexCompositeConverterConvert(TestCase):
         self.assertResult(10 / 125)
 
 
-@add_to(CompositeUnitConverter_test_suite)
-class TestAliasCompositeUnitConverterConvert(TestCase):
-    def subject(self, value, from_descriptor, to_descriptor):
-        return Unit1Unit4_2Converter.convert(value, from_descriptor, to_descriptor)
+class TestAliasCompositeUnitConverterConvert(TestConverter):
+    converter = Unit1Unit4_2Converter
+    _method = "convert"
 
     @args(
         {
             "value": 2,
-            "from_descriptor": Unit1.A / (Unit4.D**2),
-            "to_descriptor": Unit1.A / (Unit4.D**2),
+            "from_descriptor": _U_A_PER_D2,
+            "to_descriptor": _U_A_PER_D2,
         }
     )
     def test_with_same_units(self):
@@ -731,8 +716,8 @@ class TestAliasCompositeUnitConverterConvert(TestCase):
     @args(
         {
             "value": 2,
-            "from_descriptor": Unit1.A / (Unit4.D**2),
-            "to_descriptor": Unit1.a / (Unit4.d**2),
+            "from_descriptor": _U_A_PER_D2,
+            "to_descriptor": _U_a_PER_d2,
         }
     )
     def test_with_si_units(self):
@@ -741,7 +726,7 @@ class TestAliasCompositeUnitConverterConvert(TestCase):
     @args(
         {
             "value": 3,
-            "from_descriptor": Unit1.A / (Unit4.D**2),
+            "from_descriptor": _U_A_PER_D2,
             "to_descriptor": Unit5.E,
         }
     )
@@ -751,7 +736,7 @@ class TestAliasCompositeUnitConverterConvert(TestCase):
     @args(
         {
             "value": 7,
-            "from_descriptor": Unit1.a / (Unit4.d**2),
+            "from_descriptor": _U_a_PER_d2,
             "to_descriptor": Unit5.e,
         }
     )
@@ -759,16 +744,15 @@ class TestAliasCompositeUnitConverterConvert(TestCase):
         self.assertResult(7)
 
 
-@add_to(CompositeUnitConverter_test_suite)
-class TestTwiceAliasCompositeUnitConverterConvert(TestCase):
-    def subject(self, value, from_descriptor, to_descriptor):
-        return Unit6Unit4_2Converter.convert(value, from_descriptor, to_descriptor)
+class TestTwiceAliasCompositeUnitConverterConvert(TestConverter):
+    converter = Unit6Unit4_2Converter
+    _method = "convert"
 
     @args(
         {
             "value": 2,
-            "from_descriptor": Unit6.F / (Unit4.D**2),
-            "to_descriptor": Unit6.F / (Unit4.D**2),
+            "from_descriptor": _U_F_PER_D2,
+            "to_descriptor": _U_F_PER_D2,
         }
     )
     def test_with_same_units(self):
@@ -777,8 +761,8 @@ class TestTwiceAliasCompositeUnitConverterConvert(TestCase):
     @args(
         {
             "value": 2,
-            "from_descriptor": Unit6.F / (Unit4.D**2),
-            "to_descriptor": Unit6.f / (Unit4.d**2),
+            "from_descriptor": _U_F_PER_D2,
+            "to_descriptor": _U_f_PER_d2,
         }
     )
     def test_with_si_units(self):
@@ -787,7 +771,7 @@ class TestTwiceAliasCompositeUnitConverterConvert(TestCase):
     @args(
         {
             "value": 3,
-            "from_descriptor": Unit6.F / (Unit4.D**2),
+            "from_descriptor": _U_F_PER_D2,
             "to_descriptor": Unit8.H,
         }
     )
@@ -797,7 +781,7 @@ class TestTwiceAliasCompositeUnitConverterConvert(TestCase):
     @args(
         {
             "value": 7,
-            "from_descriptor": Unit6.f / (Unit4.d**2),
+            "from_descriptor": _U_f_PER_d2,
             "to_descriptor": Unit8.h,
         }
     )
@@ -807,7 +791,7 @@ class TestTwiceAliasCompositeUnitConverterConvert(TestCase):
     @args(
         {
             "value": 3,
-            "from_descriptor": Unit6.F / (Unit4.D**2),
+            "from_descriptor": _U_F_PER_D2,
             "to_descriptor": Unit1.A**2 / (Unit4.D**2),
         }
     )
@@ -817,7 +801,7 @@ class TestTwiceAliasCompositeUnitConverterConvert(TestCase):
     @args(
         {
             "value": 3,
-            "from_descriptor": Unit6.f / (Unit4.d**2),
+            "from_descriptor": _U_f_PER_d2,
             "to_descriptor": Unit1.a**2 / (Unit4.d**2),
         }
     )
@@ -825,76 +809,167 @@ class TestTwiceAliasCompositeUnitConverterConvert(TestCase):
         self.assertResult(3)
 
 
-@add_to(CompositeUnitConverter_test_suite)
-class TestCompositeUnitConverterGetFactor(TestCase):
-    def subject(self, from_descriptor, to_descriptor):
-        return Unit1Unit4Converter.get_factor(from_descriptor, to_descriptor)
+class TestCompositeUnitConverterGetFactor(TestConverter):
+    converter = Unit1Unit4Converter
+    _method = "get_factor"
 
-    @args({"from_descriptor": Unit3.C * Unit2.B, "to_descriptor": Unit1.A * Unit4.D})
+    @args({"from_descriptor": _U_C_B, "to_descriptor": _U_A_D})
     def test_with_invalid_from_descriptor(self):
         self.assertResultRaises(UnitConversionError)
 
-    @args({"from_descriptor": Unit1.A * Unit4.D, "to_descriptor": Unit3.C * Unit1.A})
+    @args({"from_descriptor": _U_A_D, "to_descriptor": _U_C_A})
     def test_with_invalid_to_descriptor(self):
         self.assertResultRaises(UnitConversionError)
 
-    @args({"from_descriptor": Unit1.A2 * Unit4.D, "to_descriptor": Unit1.A * Unit4.D})
+    @args({"from_descriptor": _U_UNIT1_A2_D, "to_descriptor": _U_A_D})
     def test_with_unregistered_from_descriptor(self):
         self.assertResultRaises(UnitConversionError)
 
-    @args({"from_descriptor": Unit1.A * Unit4.D, "to_descriptor": Unit1.A * Unit4.D2})
+    @args({"from_descriptor": _U_A_D, "to_descriptor": _U_A_UNIT4_D2})
     def test_with_unregistered_to_descriptor(self):
         self.assertResultRaises(UnitConversionError)
 
-    @args({"from_descriptor": Unit1.A * Unit4.D, "to_descriptor": Unit1.a * Unit4.d})
+    @args({"from_descriptor": _U_A_D, "to_descriptor": _U_a_d})
     def test_valid_conversion_from_AD_to_ad(self):
         self.assertResult(50)
 
-    @args({"from_descriptor": Unit1.a * Unit4.d, "to_descriptor": Unit1.A * Unit4.D})
+    @args({"from_descriptor": _U_a_d, "to_descriptor": _U_A_D})
     def test_valid_conversion_from_ad_to_AD(self):
         self.assertResultAlmost(0.02, 3)
 
-    @args({"from_descriptor": Unit1.A * Unit4.D, "to_descriptor": Unit4.D * Unit1.A})
+    @args({"from_descriptor": _U_A_D, "to_descriptor": _U_D_A})
     def test_from_AD_to_DA(self):
         self.assertResult(1)
 
 
-@add_to(CompositeUnitConverter_test_suite)
-class TestCompositeUnitConverterWithMissingDependenciesGetFactor(TestCase):
-    def subject(self, from_descriptor, to_descriptor):
-        return Unit1Unit3Converter.get_factor(from_descriptor, to_descriptor)
+class TestCompositeUnitConverterWithMissingDependenciesGetFactor(TestConverter):
+    converter = Unit1Unit3Converter
+    _method = "get_factor"
 
-    @args({"from_descriptor": Unit1.A * Unit2.B, "to_descriptor": Unit1.A * Unit3.C})
+    @args({"from_descriptor": _U_A_B, "to_descriptor": _U_A_C})
     def test_with_invalid_from_descriptor(self):
         self.assertResultRaises(UnitConversionError)
 
-    @args({"from_descriptor": Unit1.A * Unit3.C, "to_descriptor": Unit1.A * Unit2.B})
+    @args({"from_descriptor": _U_A_C, "to_descriptor": _U_A_B})
     def test_with_invalid_to_descriptor(self):
         self.assertResultRaises(UnitConversionError)
 
-    @args({"from_descriptor": Unit1.A * Unit3.C, "to_descriptor": Unit1.a * Unit3.c})
+    @args({"from_descriptor": _U_A_C, "to_descriptor": _U_a_c})
     def test_from_AC_to_ac(self):
         self.assertResultRaises(ConverterDependenciesError)
 
 
-@add_to(CompositeUnitConverter_test_suite)
-class TestUnsupportedCompositeUnitConverterGetFactor(TestCase):
-    def subject(self, from_descriptor, to_descriptor):
-        return Unit1Unit2Converter.get_factor(from_descriptor, to_descriptor)
+class TestUnsupportedCompositeUnitConverterGetFactor(TestConverter):
+    converter = Unit1Unit2Converter
+    _method = "get_factor"
 
-    @args({"from_descriptor": Unit1.A * Unit3.C, "to_descriptor": Unit1.A * Unit2.B})
+    @args({"from_descriptor": _U_A_C, "to_descriptor": _U_A_B})
     def test_with_invalid_from_descriptor(self):
         self.assertResultRaises(UnitConversionError)
 
-    @args({"from_descriptor": Unit1.A * Unit2.B, "to_descriptor": Unit1.A * Unit3.C})
+    @args({"from_descriptor": _U_A_B, "to_descriptor": _U_A_C})
     def test_with_invalid_to_descriptor(self):
         self.assertResultRaises(UnitConversionError)
 
-    @args({"from_descriptor": Unit1.A * Unit2.B, "to_descriptor": Unit1.a * Unit2.b})
+    @args({"from_descriptor": _U_A_B, "to_descriptor": _U_a_b})
     def test_from_AB_to_ab(self):
         self.assertResultRaises(UnsupportedConverterError)
 
 
+class TestIdentityConversions(TestCase):
+    def test_absolute_converter(self):
+        result = Unit1Converter.convert(3, Unit1.a, Unit1.a)
+        self.assertIs(type(result), float)
+        self.assertEqual(result, 3)
+
+    def test_relative_converter(self):
+        result = Unit2Converter.convert(3, Unit2.b, Unit2.b)
+        self.assertIs(type(result), int)
+        self.assertEqual(result, 3)
+
+
+class TestCachedConversionLookups(TestCase):
+    """
+    Converters cache their lookups per pair of descriptor snapshots; the snapshot is
+    taken on every call, so descriptors mutated in place are looked up again.
+    """
+
+    def test_get_factor_after_mutation(self):
+        from_descriptor = Unit1.A**2
+        to_descriptor = Unit1.a**2
+        self.assertEqual(
+            Unit1_2Converter.get_factor(from_descriptor, to_descriptor), 100
+        )
+
+        from_descriptor.unit = Unit1.a
+        self.assertEqual(Unit1_2Converter.get_factor(from_descriptor, to_descriptor), 1)
+
+        from_descriptor.unit = Unit1.A
+        # `**` raises the power of a dimension in place.
+        from_descriptor**1.57
+        to_descriptor**1.57
+        with self.assertRaises(UnitConversionError):
+            Unit1_2Converter.get_factor(from_descriptor, to_descriptor)
+        self.assertEqual(
+            Unit1_314Converter.get_factor(from_descriptor, to_descriptor), 10**3.14
+        )
+
+    def test_convert_after_mutation(self):
+        from_descriptor = Unit1.A**2
+        to_descriptor = Unit1.a**2
+        self.assertEqual(
+            Unit1_2Converter.convert(2, from_descriptor, to_descriptor), 200
+        )
+
+        # `**` raises the power of a dimension in place.
+        from_descriptor**1.57
+        to_descriptor**1.57
+        with self.assertRaises(UnitConversionError):
+            Unit1_2Converter.convert(2, from_descriptor, to_descriptor)
+        self.assertEqual(
+            Unit1_314Converter.convert(2, from_descriptor, to_descriptor),
+            2 * 10**3.14,
+        )
+
+    def test_relative_convert_twice_and_after_mutation(self):
+        from_descriptor = Unit2.B**1
+        self.assertEqual(Unit2Converter.convert(10, from_descriptor, Unit2.b), 3.5)
+        before = _keyed_call.cache_info()
+        self.assertEqual(Unit2Converter.convert(10, from_descriptor, Unit2.b), 3.5)
+        self.assertEqual(_keyed_call.cache_info().hits, before.hits + 1)
+
+        from_descriptor.unit = Unit2.b
+        self.assertEqual(Unit2Converter.convert(10, from_descriptor, Unit2.b), 10)
+
+        # `**` raises the power of a dimension in place.
+        from_descriptor**2
+        with self.assertRaises(UnitConversionError):
+            Unit2Converter.convert(10, from_descriptor, Unit2.b)
+
+    def test_equal_descriptors_share_an_entry(self):
+        Unit1_2Converter.get_factor(Unit1.A**2, Unit1.a**2)
+        before = _keyed_call.cache_info()
+        self.assertEqual(Unit1_2Converter.get_factor(Unit1.A**2, Unit1.a**2), 100)
+        after = _keyed_call.cache_info()
+        self.assertEqual(after.hits, before.hits + 1)
+        self.assertEqual(after.misses, before.misses)
+
+    def test_unkeyable_descriptor_is_not_cached(self):
+        descriptor = UnhashableDimension(Unit1.A, 2)
+        self.assertIsNone(_descriptor_key(descriptor))
+
+        before = _keyed_call.cache_info()
+        arguments = _cached_call(lambda *arguments: arguments, descriptor, Unit1.a**2)
+        self.assertIs(arguments[0], descriptor)
+        self.assertEqual(_keyed_call.cache_info(), before)
+
+    def test_get_factor_with_unkeyable_descriptor(self):
+        descriptor = UnhashableDimension(Unit1.A, 2)
+        self.assertEqual(Unit1_2Converter.get_factor(descriptor, Unit1.a**2), 100)
+        self.assertAlmostEqual(
+            Unit1_2Converter.get_factor(Unit1.a**2, descriptor), 0.01
+        )
+
+
 if __name__ == "__main__":
-    runner = TextTestRunner()
-    runner.run(converter_types_test_suite)
+    main()
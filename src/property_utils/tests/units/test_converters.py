@@ -1,4 +1,4 @@
-from unittest import TestSuite, TextTestRunner
+from unittest import main
 
 from unittest_extensions import TestCase, args
 
@@ -28,751 +28,484 @@ from property_utils.units.converters import (
     AliasEnergyUnitConverter,
     AliasPowerUnitConverter,
 )
+from property_utils.units.converter_types import ConverterType
 from property_utils.exceptions.units.converter_types import UnitConversionError
-from property_utils.tests.utils import add_to, def_load_tests
+from property_utils.tests.utils import def_load_tests, assert_cases
 
 
 load_tests = def_load_tests("property_utils.units.converters")
 
-converters_test_suite = TestSuite()
-
-converters_test_suite.addTests(
-    [
-        (TemperatureUnitConverter_test_suite := TestSuite()),
-        (AbsoluteTemperatureUnitConverter_test_suite := TestSuite()),
-        (LengthUnitConverter_test_suite := TestSuite()),
-        (MassUnitConverter_test_suite := TestSuite()),
-        (AmountUnitConverter_test_suite := TestSuite()),
-        (TimeUnitConverter_test_suite := TestSuite()),
-        (ElectricCurrentUnitConverter_test_suite := TestSuite()),
-        (AliasForceUnitConverter_test_suite := TestSuite()),
-        (AliasPressureUnitConverter_test_suite := TestSuite()),
-        (AliasEnergyUnitConverter_test_suite := TestSuite()),
-        (AliasPowerUnitConverter_test_suite := TestSuite()),
-    ]
-)
-
 
-@add_to(TemperatureUnitConverter_test_suite)
-class TestTemperatureUnitConverterConvertToReference(TestCase):
-    def subject(self, value, from_descriptor):
-        return RelativeTemperatureUnitConverter.convert(
-            value, from_descriptor, RelativeTemperatureUnit.CELCIUS
+class TestConverter(TestCase):
+    """
+    Runs the `(value, descriptor, expected)` rows of `cases` against `subject` as sub
+    tests; `expected` is either the converted value or the error the conversion
+    raises. Rows with a fourth item compare the converted value to `expected` up to
+    that many decimal places.
+    """
+
+    def assert_cases(self, cases) -> None:
+        assert_cases(
+            self,
+            [
+                ({"value": value, "descriptor": descriptor}, *rest)
+                for value, descriptor, *rest in cases
+            ],
+            lambda value, descriptor: self.subject(value, descriptor),
+            self._assert_converted,
         )
 
-    @args({"value": 300, "from_descriptor": AbsoluteTemperatureUnit.KELVIN})
-    def test_from_kelvin(self):
-        self.assertResultAlmost(26.85, 2)
-
-    @args({"value": 289.23, "from_descriptor": RelativeTemperatureUnit.FAHRENHEIT})
-    def test_from_fahrenheit(self):
-        self.assertResultAlmost(142.905, 2)
-
-    @args({"value": 467, "from_descriptor": AbsoluteTemperatureUnit.RANKINE})
-    def test_from_rankine(self):
-        self.assertResultAlmost(-13.705, 2)
-
-    @args({"value": 467, "from_descriptor": LengthUnit.CENTI_METER})
-    def test_from_invalid_descriptor(self):
-        self.assertResultRaises(UnitConversionError)
-
-    @args({"value": "231.2", "from_descriptor": AbsoluteTemperatureUnit.KELVIN})
-    def test_with_invalid_value(self):
-        self.assertResultRaises(UnitConversionError)
-
-
-@add_to(TemperatureUnitConverter_test_suite)
-class TestTemperatureUnitConverterConvertFromReference(TestCase):
-    def subject(self, value, to_descriptor):
-        return RelativeTemperatureUnitConverter.convert(
-            value, RelativeTemperatureUnit.CELCIUS, to_descriptor
-        )
-
-    @args({"value": 100, "to_descriptor": RelativeTemperatureUnit.CELCIUS})
-    def test_to_celcius(self):
-        self.assertResult(100)
-
-    @args({"value": 10, "to_descriptor": AbsoluteTemperatureUnit.KELVIN})
-    def test_to_kelvin(self):
-        self.assertResult(283.15)
+    def _assert_converted(self, result, expected, places=None) -> None:
+        if places is None:
+            self.assertEqual(result, expected)
+        else:
+            self.assertAlmostEqual(result, expected, places)
 
-    @args({"value": 100, "to_descriptor": RelativeTemperatureUnit.FAHRENHEIT})
-    def test_to_fahrenheit(self):
-        self.assertResult(212)
 
-    @args({"value": 67.98, "to_descriptor": AbsoluteTemperatureUnit.RANKINE})
-    def test_to_rankine(self):
-        self.assertResultAlmost(614.03, 2)
+class TestConvertToReference(TestConverter):
+    """
+    Converts the test value from the test descriptor to the reference unit of
+    `converter`.
+    """
 
-    @args({"value": 467, "to_descriptor": LengthUnit.FOOT})
-    def test_to_invalid_descriptor(self):
-        self.assertResultRaises(UnitConversionError)
+    converter: ConverterType
 
-
-@add_to(AbsoluteTemperatureUnitConverter_test_suite)
-class TestAbsoluteTemperatureUnitConverterConvertToReference(TestCase):
     def subject(self, value, from_descriptor):
-        return AbsoluteTemperatureUnitConverter.convert(
-            value, from_descriptor, AbsoluteTemperatureUnit.KELVIN
+        return self.converter.convert(
+            value, from_descriptor, self.converter.reference_unit
         )
 
-    @args({"value": 300.5, "from_descriptor": AbsoluteTemperatureUnit.KELVIN})
-    def test_from_kelvin(self):
-        self.assertResult(300.5)
-
-    @args({"value": 450, "from_descriptor": AbsoluteTemperatureUnit.RANKINE})
-    def test_from_rankine(self):
-        self.assertResultAlmost(450 / 1.8)
 
-    @args({"value": 25, "from_descriptor": RelativeTemperatureUnit.CELCIUS})
-    def test_from_celcius(self):
-        self.assertResult(298.15)
+class TestConvertFromReference(TestConverter):
+    """
+    Converts the test value from the reference unit of `converter` to the test
+    descriptor.
+    """
 
-    @args({"value": 212, "from_descriptor": RelativeTemperatureUnit.FAHRENHEIT})
-    def test_from_fahrenheit(self):
-        self.assertResultAlmost(373.15)
+    converter: ConverterType
 
-
-@add_to(AbsoluteTemperatureUnitConverter_test_suite)
-class TestAbsoluteTemperatureUnitConverterConvertFromReference(TestCase):
     def subject(self, value, to_descriptor):
-        return AbsoluteTemperatureUnitConverter.convert(
-            value, AbsoluteTemperatureUnit.KELVIN, to_descriptor
+        return self.converter.convert(
+            value, self.converter.reference_unit, to_descriptor
         )
 
-    @args({"value": 367.29, "to_descriptor": AbsoluteTemperatureUnit.KELVIN})
-    def test_to_kelvin(self):
-        self.assertResult(367.29)
-
-    @args({"value": 200.50, "to_descriptor": AbsoluteTemperatureUnit.RANKINE})
-    def test_to_rankine(self):
-        self.assertResult(200.50 * 1.8)
-
-    @args({"value": 10.5, "to_descriptor": RelativeTemperatureUnit.CELCIUS})
-    def test_to_celcius(self):
-        self.assertResult(-262.65)
-
-    @args({"value": 400, "to_descriptor": RelativeTemperatureUnit.FAHRENHEIT})
-    def test_to_fahrenheit(self):
-        self.assertResultAlmost(260.33)
-
-
-@add_to(LengthUnitConverter_test_suite)
-class TestLengthUnitConverterConvertToReference(TestCase):
-    def subject(self, value, from_descriptor):
-        return LengthUnitConverter.convert(value, from_descriptor, LengthUnit.METER)
-
-    @args({"value": 283, "from_descriptor": LengthUnit.MILLI_METER})
-    def test_from_milli_meter(self):
-        self.assertResultAlmost(0.283, 3)
-
-    @args({"value": 156, "from_descriptor": LengthUnit.CENTI_METER})
-    def test_from_centi_meter(self):
-        self.assertResult(1.56)
-
-    @args({"value": 29.013, "from_descriptor": LengthUnit.METER})
-    def test_from_meter(self):
-        self.assertResult(29.013)
-
-    @args({"value": 9.51, "from_descriptor": LengthUnit.KILO_METER})
-    def test_from_kilo_meter(self):
-        self.assertResult(9_510)
-
-    @args({"value": 56, "from_descriptor": LengthUnit.INCH})
-    def test_from_inch(self):
-        self.assertResultAlmost(56 * 2.54 / 100, 3)
-
-    @args({"value": 23.2, "from_descriptor": LengthUnit.FOOT})
-    def test_from_foot(self):
-        self.assertResultAlmost(23.2 * 12 * 2.54 / 100, 3)
-
-    @args({"value": 2.4, "from_descriptor": LengthUnit.YARD})
-    def test_from_yard(self):
-        self.assertResult(2.4 / 1.094)
-
-    @args({"value": 2.01, "from_descriptor": LengthUnit.MILE})
-    def test_from_mile(self):
-        self.assertResult(2.01 * 1609)
-
-    @args({"value": 5.08, "from_descriptor": LengthUnit.NAUTICAL_MILE})
-    def test_from_nautical_mile(self):
-        self.assertResult(5.08 * 1852)
-
-
-@add_to(LengthUnitConverter_test_suite)
-class TestLengthUnitConverterConvertFromReference(TestCase):
-    def subject(self, value, to_descriptor):
-        return LengthUnitConverter.convert(value, LengthUnit.METER, to_descriptor)
-
-    @args({"value": 0.09862, "to_descriptor": LengthUnit.MILLI_METER})
-    def test_to_milli_meter(self):
-        self.assertResult(98.62)
-
-    @args({"value": 2.02, "to_descriptor": LengthUnit.CENTI_METER})
-    def test_to_centi_meter(self):
-        self.assertResult(202)
-
-    @args({"value": 5, "to_descriptor": LengthUnit.METER})
-    def test_to_meter(self):
-        self.assertResult(5)
-
-    @args({"value": 25.4, "to_descriptor": LengthUnit.KILO_METER})
-    def test_to_kilo_meter(self):
-        self.assertResultAlmost(0.0254, 4)
-
-    @args({"value": 3.3, "to_descriptor": LengthUnit.INCH})
-    def test_to_inch(self):
-        self.assertResultAlmost(3.3 * 100 / 2.54, 2)
-
-    @args({"value": 15, "to_descriptor": LengthUnit.FOOT})
-    def test_to_foot(self):
-        self.assertResultAlmost(15 * 100 / 2.54 / 12, 2)
-
-    @args({"value": 5, "to_descriptor": LengthUnit.YARD})
-    def test_to_yard(self):
-        self.assertResult(5 * 1.094)
-
-    @args({"value": 2_000, "to_descriptor": LengthUnit.MILE})
-    def test_to_mile(self):
-        self.assertResultAlmost(2000 / 1609, 4)
-
-    @args({"value": 562, "to_descriptor": LengthUnit.NAUTICAL_MILE})
-    def test_to_nautical_mile(self):
-        self.assertResult(562 / 1852)
-
-
-@add_to(MassUnitConverter_test_suite)
-class TestMassUnitConverterConvertToReference(TestCase):
-    def subject(self, value, from_descriptor):
-        return MassUnitConverter.convert(value, from_descriptor, MassUnit.KILO_GRAM)
-
-    @args({"value": 12, "from_descriptor": MassUnit.MILLI_GRAM})
-    def test_from_milli_gram(self):
-        self.assertResult(0.000012)
-
-    @args({"value": 101, "from_descriptor": MassUnit.GRAM})
-    def test_from_gram(self):
-        self.assertResult(0.101)
-
-    @args({"value": 67.398, "from_descriptor": MassUnit.KILO_GRAM})
-    def test_from_kilo_gram(self):
-        self.assertResult(67.398)
-
-    @args({"value": 2.37, "from_descriptor": MassUnit.METRIC_TONNE})
-    def test_from_metric_tonne(self):
-        self.assertResult(2_370)
-
-    @args({"value": 20, "from_descriptor": MassUnit.POUND})
-    def test_from_pound(self):
-        self.assertResultAlmost(20 / 2.205, 2)
-
 
-@add_to(MassUnitConverter_test_suite)
-class TestMassUnitConverterConvertFromReference(TestCase):
-    def subject(self, value, to_descriptor):
-        return MassUnitConverter.convert(value, MassUnit.KILO_GRAM, to_descriptor)
+class TestTemperatureUnitConverterConvertToReference(TestConvertToReference):
+    converter = RelativeTemperatureUnitConverter
 
-    @args({"value": 0.013, "to_descriptor": MassUnit.MILLI_GRAM})
-    def test_to_milli_gram(self):
-        self.assertResult(13_000)
+    def test_convert(self):
+        self.assert_cases(
+            [
+                (300, AbsoluteTemperatureUnit.KELVIN, 26.85, 2),
+                (289.23, RelativeTemperatureUnit.FAHRENHEIT, 142.905, 2),
+                (467, AbsoluteTemperatureUnit.RANKINE, -13.705, 2),
+                (467, LengthUnit.CENTI_METER, UnitConversionError),
+                ("231.2", AbsoluteTemperatureUnit.KELVIN, UnitConversionError),
+            ]
+        )
 
-    @args({"value": 2, "to_descriptor": MassUnit.GRAM})
-    def test_to_gram(self):
-        self.assertResult(2_000)
 
-    @args({"value": 2.60, "to_descriptor": MassUnit.KILO_GRAM})
-    def test_to_kilo_gram(self):
-        self.assertResult(2.60)
+class TestTemperatureUnitConverterConvertFromReference(TestConvertFromReference):
+    converter = RelativeTemperatureUnitConverter
 
-    @args({"value": 690, "to_descriptor": MassUnit.METRIC_TONNE})
-    def test_to_metric_tonne(self):
-        self.assertResultAlmost(0.690, 3)
+    def test_convert(self):
+        self.assert_cases(
+            [
+                (100, RelativeTemperatureUnit.CELCIUS, 100),
+                (10, AbsoluteTemperatureUnit.KELVIN, 283.15),
+                (100, RelativeTemperatureUnit.FAHRENHEIT, 212),
+                (67.98, AbsoluteTemperatureUnit.RANKINE, 614.03, 2),
+                (467, LengthUnit.FOOT, UnitConversionError),
+            ]
+        )
 
-    @args({"value": 0.84, "to_descriptor": MassUnit.POUND})
-    def test_to_pound(self):
-        self.assertResult(0.84 * 2.205)
 
+class TestAbsoluteTemperatureUnitConverterConvertToReference(TestConvertToReference):
+    converter = AbsoluteTemperatureUnitConverter
 
-@add_to(AmountUnitConverter_test_suite)
-class TestAmountUnitConverterConvertToReference(TestCase):
-    def subject(self, value, from_descriptor):
-        return AmountUnitConverter.convert(value, from_descriptor, AmountUnit.MOL)
-
-    @args({"value": 90, "from_descriptor": AmountUnit.MOL})
-    def test_from_mol(self):
-        self.assertResult(90)
+    def test_convert(self):
+        self.assert_cases(
+            [
+                (300.5, AbsoluteTemperatureUnit.KELVIN, 300.5),
+                (450, AbsoluteTemperatureUnit.RANKINE, 450 / 1.8, 7),
+                (25, RelativeTemperatureUnit.CELCIUS, 298.15),
+                (212, RelativeTemperatureUnit.FAHRENHEIT, 373.15, 7),
+            ]
+        )
 
-    @args({"value": 45, "from_descriptor": AmountUnit.KILO_MOL})
-    def test_from_kilo_mol(self):
-        self.assertResult(45_000)
 
+class TestAbsoluteTemperatureUnitConverterConvertFromReference(
+    TestConvertFromReference
+):
+    converter = AbsoluteTemperatureUnitConverter
 
-@add_to(AmountUnitConverter_test_suite)
-class TestAmountUnitConverterConvertFromReference(TestCase):
-    def subject(self, value, to_descriptor):
-        return AmountUnitConverter.convert(value, AmountUnit.MOL, to_descriptor)
-
-    @args({"value": 23.333, "to_descriptor": AmountUnit.MOL})
-    def test_to_mol(self):
-        self.assertResult(23.333)
+    def test_convert(self):
+        self.assert_cases(
+            [
+                (367.29, AbsoluteTemperatureUnit.KELVIN, 367.29),
+                (200.50, AbsoluteTemperatureUnit.RANKINE, 200.50 * 1.8),
+                (10.5, RelativeTemperatureUnit.CELCIUS, -262.65),
+                (400, RelativeTemperatureUnit.FAHRENHEIT, 260.33, 7),
+            ]
+        )
 
-    @args({"value": 29, "to_descriptor": AmountUnit.KILO_MOL})
-    def test_to_kilo_mol(self):
-        self.assertResult(0.029)
 
+class TestLengthUnitConverterConvertToReference(TestConvertToReference):
+    converter = LengthUnitConverter
+
+    def test_convert(self):
+        self.assert_cases(
+            [
+                (283, LengthUnit.MILLI_METER, 0.283, 3),
+                (156, LengthUnit.CENTI_METER, 1.56),
+                (29.013, LengthUnit.METER, 29.013),
+                (9.51, LengthUnit.KILO_METER, 9_510),
+                (56, LengthUnit.INCH, 56 * 2.54 / 100, 3),
+                (23.2, LengthUnit.FOOT, 23.2 * 12 * 2.54 / 100, 3),
+                (2.4, LengthUnit.YARD, 2.4 / 1.094),
+                (2.01, LengthUnit.MILE, 2.01 * 1609),
+                (5.08, LengthUnit.NAUTICAL_MILE, 5.08 * 1852),
+            ]
+        )
 
-@add_to(TimeUnitConverter_test_suite)
-class TestTimeUnitConverterConvertToReference(TestCase):
-    def subject(self, value, from_descriptor):
-        return TimeUnitConverter.convert(value, from_descriptor, TimeUnit.SECOND)
 
-    @args({"value": 98.01, "from_descriptor": TimeUnit.MILLI_SECOND})
-    def test_from_milli_second(self):
-        self.assertResultAlmost(0.09801, 5)
+class TestLengthUnitConverterConvertFromReference(TestConvertFromReference):
+    converter = LengthUnitConverter
+
+    def test_convert(self):
+        self.assert_cases(
+            [
+                (0.09862, LengthUnit.MILLI_METER, 98.62),
+                (2.02, LengthUnit.CENTI_METER, 202),
+                (5, LengthUnit.METER, 5),
+                (25.4, LengthUnit.KILO_METER, 0.0254, 4),
+                (3.3, LengthUnit.INCH, 3.3 * 100 / 2.54, 2),
+                (15, LengthUnit.FOOT, 15 * 100 / 2.54 / 12, 2),
+                (5, LengthUnit.YARD, 5 * 1.094),
+                (2_000, LengthUnit.MILE, 2000 / 1609, 4),
+                (562, LengthUnit.NAUTICAL_MILE, 562 / 1852),
+            ]
+        )
 
-    @args({"value": 222, "from_descriptor": TimeUnit.SECOND})
-    def test_from_second(self):
-        self.assertResultAlmost(222)
 
-    @args({"value": 2.5, "from_descriptor": TimeUnit.MINUTE})
-    def test_from_minute(self):
-        self.assertResult(150)
+class TestMassUnitConverterConvertToReference(TestConvertToReference):
+    converter = MassUnitConverter
 
-    @args({"value": 0.25, "from_descriptor": TimeUnit.HOUR})
-    def test_from_hour(self):
-        self.assertResult(15 * 60)
+    def test_convert(self):
+        self.assert_cases(
+            [
+                (12, MassUnit.MILLI_GRAM, 0.000012),
+                (101, MassUnit.GRAM, 0.101),
+                (67.398, MassUnit.KILO_GRAM, 67.398),
+                (2.37, MassUnit.METRIC_TONNE, 2_370),
+                (20, MassUnit.POUND, 20 / 2.205, 2),
+            ]
+        )
 
-    @args({"value": 7, "from_descriptor": TimeUnit.DAY})
-    def test_from_day(self):
-        self.assertResult(7 * 24 * 60 * 60)
 
-    @args({"value": 0.3, "from_descriptor": TimeUnit.WEEK})
-    def test_from_week(self):
-        self.assertResultAlmost(0.3 * 7 * 24 * 60 * 60, 1)
+class TestMassUnitConverterConvertFromReference(TestConvertFromReference):
+    converter = MassUnitConverter
 
-    @args({"value": 2, "from_descriptor": TimeUnit.MONTH})
-    def test_from_month(self):
-        self.assertResultAlmost(2 * (365 / 12) * 24 * 60 * 60, 1)
+    def test_convert(self):
+        self.assert_cases(
+            [
+                (0.013, MassUnit.MILLI_GRAM, 13_000),
+                (2, MassUnit.GRAM, 2_000),
+                (2.60, MassUnit.KILO_GRAM, 2.60),
+                (690, MassUnit.METRIC_TONNE, 0.690, 3),
+                (0.84, MassUnit.POUND, 0.84 * 2.205),
+            ]
+        )
 
-    @args({"value": 1.5, "from_descriptor": TimeUnit.YEAR})
-    def test_from_year(self):
-        self.assertResultAlmost(1.5 * 365 * 24 * 60 * 60, 1)
 
+class TestAmountUnitConverterConvertToReference(TestConvertToReference):
+    converter = AmountUnitConverter
 
-@add_to(TimeUnitConverter_test_suite)
-class TestTimeUnitConverterConvertFromReference(TestCase):
-    def subject(self, value, to_descriptor):
-        return TimeUnitConverter.convert(value, TimeUnit.SECOND, to_descriptor)
+    def test_convert(self):
+        self.assert_cases(
+            [
+                (90, AmountUnit.MOL, 90),
+                (45, AmountUnit.KILO_MOL, 45_000),
+            ]
+        )
 
-    @args({"value": 3, "to_descriptor": TimeUnit.MILLI_SECOND})
-    def test_to_milli_second(self):
-        self.assertResult(3_000)
 
-    @args({"value": 2.3, "to_descriptor": TimeUnit.SECOND})
-    def test_to_second(self):
-        self.assertResult(2.3)
+class TestAmountUnitConverterConvertFromReference(TestConvertFromReference):
+    converter = AmountUnitConverter
 
-    @args({"value": 100, "to_descriptor": TimeUnit.MINUTE})
-    def test_to_minute(self):
-        self.assertResult(100.0 / 60)
+    def test_convert(self):
+        self.assert_cases(
+            [
+                (23.333, AmountUnit.MOL, 23.333),
+                (29, AmountUnit.KILO_MOL, 0.029),
+            ]
+        )
 
-    @args({"value": 1000, "to_descriptor": TimeUnit.HOUR})
-    def test_to_hour(self):
-        self.assertResult(1000.0 / 60 / 60)
 
-    @args({"value": 5672, "to_descriptor": TimeUnit.DAY})
-    def test_to_day(self):
-        self.assertResult(5672.0 / 60 / 60 / 24)
+class TestTimeUnitConverterConvertToReference(TestConvertToReference):
+    converter = TimeUnitConverter
+
+    def test_convert(self):
+        self.assert_cases(
+            [
+                (98.01, TimeUnit.MILLI_SECOND, 0.09801, 5),
+                (222, TimeUnit.SECOND, 222, 7),
+                (2.5, TimeUnit.MINUTE, 150),
+                (0.25, TimeUnit.HOUR, 15 * 60),
+                (7, TimeUnit.DAY, 7 * 24 * 60 * 60),
+                (0.3, TimeUnit.WEEK, 0.3 * 7 * 24 * 60 * 60, 1),
+                (2, TimeUnit.MONTH, 2 * (365 / 12) * 24 * 60 * 60, 1),
+                (1.5, TimeUnit.YEAR, 1.5 * 365 * 24 * 60 * 60, 1),
+            ]
+        )
 
-    @args({"value": 56_000, "to_descriptor": TimeUnit.WEEK})
-    def test_to_week(self):
-        self.assertResultAlmost(56_000 / 60 / 60 / 24 / 7)
 
-    @args({"value": 476_032, "to_descriptor": TimeUnit.MONTH})
-    def test_to_month(self):
-        self.assertResultAlmost(476_032 / 60 / 60 / 24 / (365 / 12))
+class TestTimeUnitConverterConvertFromReference(TestConvertFromReference):
+    converter = TimeUnitConverter
+
+    def test_convert(self):
+        self.assert_cases(
+            [
+                (3, TimeUnit.MILLI_SECOND, 3_000),
+                (2.3, TimeUnit.SECOND, 2.3),
+                (100, TimeUnit.MINUTE, 100.0 / 60),
+                (1000, TimeUnit.HOUR, 1000.0 / 60 / 60),
+                (5672, TimeUnit.DAY, 5672.0 / 60 / 60 / 24),
+                (56_000, TimeUnit.WEEK, 56_000 / 60 / 60 / 24 / 7, 7),
+                (476_032, TimeUnit.MONTH, 476_032 / 60 / 60 / 24 / (365 / 12), 7),
+                (1_090_382, TimeUnit.YEAR, 1_090_382 / 365 / 24 / 60 / 60, 7),
+            ]
+        )
 
-    @args({"value": 1_090_382, "to_descriptor": TimeUnit.YEAR})
-    def test_to_year(self):
-        self.assertResultAlmost(1_090_382 / 365 / 24 / 60 / 60)
 
+class TestElectricCurrentUnitConvertConvertToReference(TestConvertToReference):
+    converter = ElectricCurrentUnitConverter
 
-@add_to(ElectricCurrentUnitConverter_test_suite)
-class TestElectricCurrentUnitConvertConvertToReference(TestCase):
-    def subject(self, value, from_descriptor):
-        return ElectricCurrentUnitConverter.convert(
-            value, from_descriptor, ElectricCurrentUnit.AMPERE
+    def test_convert(self):
+        self.assert_cases(
+            [
+                (5800, ElectricCurrentUnit.MILLI_AMPERE, 5.800),
+                (3.1415, ElectricCurrentUnit.AMPERE, 3.1415),
+                (0.32, ElectricCurrentUnit.KILO_AMPERE, 320),
+            ]
         )
 
-    @args({"value": 5800, "from_descriptor": ElectricCurrentUnit.MILLI_AMPERE})
-    def test_from_milli_ampere(self):
-        self.assertResult(5.800)
 
-    @args({"value": 3.1415, "from_descriptor": ElectricCurrentUnit.AMPERE})
-    def test_from_ampere(self):
-        self.assertResult(3.1415)
+class TestElectricCurrentUnitConverterConvertFromReference(TestConvertFromReference):
+    converter = ElectricCurrentUnitConverter
 
-    @args({"value": 0.32, "from_descriptor": ElectricCurrentUnit.KILO_AMPERE})
-    def test_from_kilo_ampere(self):
-        self.assertResult(320)
-
-
-@add_to(ElectricCurrentUnitConverter_test_suite)
-class TestElectricCurrentUnitConverterConvertFromReference(TestCase):
-    def subject(self, value, to_descriptor):
-        return ElectricCurrentUnitConverter.convert(
-            value, ElectricCurrentUnit.AMPERE, to_descriptor
+    def test_convert(self):
+        self.assert_cases(
+            [
+                (0.29, ElectricCurrentUnit.MILLI_AMPERE, 290),
+                (46720, ElectricCurrentUnit.AMPERE, 46720),
+            ]
         )
 
-    @args({"value": 0.29, "to_descriptor": ElectricCurrentUnit.MILLI_AMPERE})
-    def test_to_milli_ampere(self):
-        self.assertResult(290)
-
-    @args({"value": 46720, "to_descriptor": ElectricCurrentUnit.AMPERE})
-    def test_to_ampere(self):
-        self.assertResult(46720)
-
     @args({"value": 326.9, "to_descriptor": ElectricCurrentUnit.KILO_AMPERE})
     def test_to_kilo_ampere(self):
         self.assertResultAlmost(0.326, delta=0.001)
 
 
-@add_to(AliasForceUnitConverter_test_suite)
-class TestAliasForceUnitConverterConvertToReference(TestCase):
-    def subject(self, value, from_descriptor):
-        return AliasForceUnitConverter.convert(value, from_descriptor, ForceUnit.NEWTON)
-
-    @args({"value": 1450, "from_descriptor": ForceUnit.NEWTON})
-    def test_from_newton(self):
-        self.assertResult(1450)
-
-    @args({"value": 15_000, "from_descriptor": ForceUnit.DYNE})
-    def test_from_dyne(self):
-        self.assertResultAlmost(0.15, 5)
+class TestAliasForceUnitConverterConvertToReference(TestConvertToReference):
+    converter = AliasForceUnitConverter
 
-
-@add_to(AliasForceUnitConverter_test_suite)
-class TestAliasForceUnitConverterConvertFromReference(TestCase):
-    def subject(self, value, to_descriptor):
-        return AliasForceUnitConverter.convert(value, ForceUnit.NEWTON, to_descriptor)
-
-    @args({"value": 284.008, "to_descriptor": ForceUnit.NEWTON})
-    def test_to_newton(self):
-        self.assertResult(284.008)
-
-    @args({"value": 28, "to_descriptor": ForceUnit.DYNE})
-    def test_to_dyne(self):
-        self.assertResult(2_800_000)
-
-    @args(
-        {
-            "value": 20,
-            "to_descriptor": MassUnit.KILO_GRAM
-            * LengthUnit.METER
-            / (TimeUnit.SECOND**2),
-        }
-    )
-    def test_to_aliased_si_units(self):
-        self.assertResult(20)
-
-    @args(
-        {
-            "value": 200,
-            "to_descriptor": MassUnit.KILO_GRAM
-            * LengthUnit.KILO_METER
-            / (TimeUnit.SECOND**2),
-        }
-    )
-    def test_to_aliased_units(self):
-        self.assertResult(0.2)
-
-
-@add_to(AliasPressureUnitConverter_test_suite)
-class TestAliasPressureUnitConverterConvertToReference(TestCase):
-    def subject(self, value, from_descriptor):
-        return AliasPressureUnitConverter.convert(
-            value, from_descriptor, PressureUnit.BAR
+    def test_convert(self):
+        self.assert_cases(
+            [
+                (1450, ForceUnit.NEWTON, 1450),
+                (15_000, ForceUnit.DYNE, 0.15, 5),
+            ]
         )
 
-    @args({"value": 2500, "from_descriptor": PressureUnit.MILLI_BAR})
-    def test_from_millibar(self):
-        self.assertResult(2.500)
-
-    @args({"value": 17.45, "from_descriptor": PressureUnit.BAR})
-    def test_from_bar(self):
-        self.assertResult(17.45)
-
-    @args({"value": 29, "from_descriptor": PressureUnit.PSI})
-    def test_from_psi(self):
-        self.assertResultAlmost(1.999, 3)
 
-    @args({"value": 243_000, "from_descriptor": PressureUnit.PASCAL})
-    def test_from_pascal(self):
-        self.assertResult(2.43)
-
-    @args({"value": 345.6, "from_descriptor": PressureUnit.KILO_PASCAL})
-    def test_from_kilo_pascal(self):
-        self.assertResultAlmost(3.456, 3)
-
-    @args({"value": 25, "from_descriptor": PressureUnit.MEGA_PASCAL})
-    def test_from_mega_pascal(self):
-        self.assertResult(250)
-
-
-@add_to(AliasPressureUnitConverter_test_suite)
-class TestAliasPressureUnitConverterConvertFromReference(TestCase):
-    def subject(self, value, to_descriptor):
-        return AliasPressureUnitConverter.convert(
-            value, PressureUnit.BAR, to_descriptor
+class TestAliasForceUnitConverterConvertFromReference(TestConvertFromReference):
+    converter = AliasForceUnitConverter
+
+    def test_convert(self):
+        self.assert_cases(
+            [
+                (284.008, ForceUnit.NEWTON, 284.008),
+                (28, ForceUnit.DYNE, 2_800_000),
+                (20, MassUnit.KILO_GRAM * LengthUnit.METER / (TimeUnit.SECOND**2), 20),
+                (
+                    200,
+                    MassUnit.KILO_GRAM * LengthUnit.KILO_METER / (TimeUnit.SECOND**2),
+                    0.2,
+                ),
+            ]
         )
 
-    @args({"value": 32.78, "to_descriptor": PressureUnit.MILLI_BAR})
-    def test_to_millibar(self):
-        self.assertResult(32_780)
-
-    @args({"value": 4, "to_descriptor": PressureUnit.PSI})
-    def test_to_psi(self):
-        self.assertResultAlmost(58.0152, 4)
-
-    @args({"value": 3.56, "to_descriptor": PressureUnit.PASCAL})
-    def test_to_pascal(self):
-        self.assertResult(356_000)
-
-    @args({"value": 0.55, "to_descriptor": PressureUnit.KILO_PASCAL})
-    def test_to_kilo_pascal(self):
-        self.assertResultAlmost(55.0, 2)
-
-    @args({"value": 2.7, "to_descriptor": PressureUnit.MEGA_PASCAL})
-    def test_to_mega_pascal(self):
-        self.assertResult(0.27)
-
-    @args(
-        {
-            "value": 1.5,
-            "to_descriptor": MassUnit.KILO_GRAM
-            / LengthUnit.METER
-            / (TimeUnit.SECOND**2),
-        }
-    )
-    def test_to_aliased_si_units(self):
-        self.assertResult(150_000)
-
-    @args(
-        {
-            "value": 1.5,
-            "to_descriptor": MassUnit.GRAM / LengthUnit.METER / (TimeUnit.SECOND**2),
-        }
-    )
-    def test_to_aliased_units(self):
-        self.assertResult(150_000_000)
-
-    @args({"value": 10, "to_descriptor": ForceUnit.NEWTON / LengthUnit.METER**2})
-    def test_to_composite_si_units(self):
-        self.assertResult(1_000_000)
-
-    @args({"value": 10, "to_descriptor": ForceUnit.DYNE / LengthUnit.METER**2})
-    def test_to_composite_units(self):
-        self.assertResult(100_000_000_000)
-
-
-@add_to(AliasEnergyUnitConverter_test_suite)
-class TestAliasEnergyUnitConverterConvertToReference(TestCase):
-    def subject(self, value, from_descriptor):
-        return AliasEnergyUnitConverter.convert(
-            value, from_descriptor, EnergyUnit.JOULE
-        )
 
-    @args({"value": 10.32, "from_descriptor": EnergyUnit.JOULE})
-    def test_from_joule(self):
-        self.assertResult(10.32)
+class TestAliasPressureUnitConverterConvertToReference(TestConvertToReference):
+    converter = AliasPressureUnitConverter
 
-    @args({"value": 23, "from_descriptor": EnergyUnit.KILO_JOULE})
-    def test_from_kilo_joule(self):
-        self.assertResult(23_000)
+    def test_convert(self):
+        self.assert_cases(
+            [
+                (2500, PressureUnit.MILLI_BAR, 2.500),
+                (17.45, PressureUnit.BAR, 17.45),
+                (29, PressureUnit.PSI, 1.999, 3),
+                (243_000, PressureUnit.PASCAL, 2.43),
+                (345.6, PressureUnit.KILO_PASCAL, 3.456, 3),
+                (25, PressureUnit.MEGA_PASCAL, 250),
+            ]
+        )
 
-    @args({"value": 0.0505, "from_descriptor": EnergyUnit.MEGA_JOULE})
-    def test_from_mega_joule(self):
-        self.assertResult(50_500)
 
-    @args({"value": 1.016, "from_descriptor": EnergyUnit.GIGA_JOULE})
-    def test_from_giga_joule(self):
-        self.assertResultAlmost(1_016_000_000, 1)
+class TestAliasPressureUnitConverterConvertFromReference(TestConvertFromReference):
+    converter = AliasPressureUnitConverter
+
+    def test_convert(self):
+        self.assert_cases(
+            [
+                (32.78, PressureUnit.MILLI_BAR, 32_780),
+                (4, PressureUnit.PSI, 58.0152, 4),
+                (3.56, PressureUnit.PASCAL, 356_000),
+                (0.55, PressureUnit.KILO_PASCAL, 55.0, 2),
+                (2.7, PressureUnit.MEGA_PASCAL, 0.27),
+                (
+                    1.5,
+                    MassUnit.KILO_GRAM / LengthUnit.METER / (TimeUnit.SECOND**2),
+                    150_000,
+                ),
+                (
+                    1.5,
+                    MassUnit.GRAM / LengthUnit.METER / (TimeUnit.SECOND**2),
+                    150_000_000,
+                ),
+                (10, ForceUnit.NEWTON / LengthUnit.METER**2, 1_000_000),
+                (10, ForceUnit.DYNE / LengthUnit.METER**2, 100_000_000_000),
+            ]
+        )
 
-    @args({"value": 520, "from_descriptor": EnergyUnit.CALORIE})
-    def test_from_calorie(self):
-        self.assertResult(520 * 4.184)
 
-    @args({"value": 666, "from_descriptor": EnergyUnit.KILO_CALORIE})
-    def test_from_kilo_calorie(self):
-        self.assertResult(666 * 1000 * 4.184)
+class TestAliasEnergyUnitConverterConvertToReference(TestConvertToReference):
+    converter = AliasEnergyUnitConverter
+
+    def test_convert(self):
+        self.assert_cases(
+            [
+                (10.32, EnergyUnit.JOULE, 10.32),
+                (23, EnergyUnit.KILO_JOULE, 23_000),
+                (0.0505, EnergyUnit.MEGA_JOULE, 50_500),
+                (1.016, EnergyUnit.GIGA_JOULE, 1_016_000_000, 1),
+                (520, EnergyUnit.CALORIE, 520 * 4.184),
+                (666, EnergyUnit.KILO_CALORIE, 666 * 1000 * 4.184),
+                (0.3, EnergyUnit.BTU, 0.3 * 1055),
+                (5.8291e16, EnergyUnit.ELECTRONVOLT, 5.8291e16 / 6.242e18, 7),
+                (2, EnergyUnit.WATTHOUR, 7200),
+                (7, EnergyUnit.KILO_WATTHOUR, 7 * 3600 * 1000, 7),
+            ]
+        )
 
-    @args({"value": 0.3, "from_descriptor": EnergyUnit.BTU})
-    def test_from_btu(self):
-        self.assertResult(0.3 * 1055)
 
-    @args({"value": 5.8291e16, "from_descriptor": EnergyUnit.ELECTRONVOLT})
-    def test_from_electronvolt(self):
-        self.assertResultAlmost(5.8291e16 / 6.242e18)
+class TestAliasEnergyUnitConverterConvertFromReference(TestConvertFromReference):
+    converter = AliasEnergyUnitConverter
+
+    def test_convert(self):
+        self.assert_cases(
+            [
+                (10.32, EnergyUnit.JOULE, 10.32),
+                (5_000, EnergyUnit.KILO_JOULE, 5),
+                (67_032, EnergyUnit.MEGA_JOULE, 0.067032),
+                (232_001, EnergyUnit.GIGA_JOULE, 0.000232001, 9),
+                (10, EnergyUnit.CALORIE, 10 / 4.184),
+                (3_200, EnergyUnit.KILO_CALORIE, 3200 / 4.184 / 1000, 4),
+                (5_000, EnergyUnit.BTU, 5000 / 1055),
+                (5.27002e-16, EnergyUnit.ELECTRONVOLT, 5.27002e-16 * 6.242e18, 7),
+                (8_000, EnergyUnit.WATTHOUR, 8000 / 3600),
+                (100_000, EnergyUnit.KILO_WATTHOUR, 100_000 / 3600 / 1000, 7),
+                (
+                    20.1,
+                    MassUnit.KILO_GRAM * (LengthUnit.METER**2) / (TimeUnit.SECOND**2),
+                    20.1,
+                ),
+                (
+                    7,
+                    MassUnit.GRAM * (LengthUnit.METER**2) / (TimeUnit.SECOND**2),
+                    7_000,
+                ),
+                (8, ForceUnit.NEWTON * LengthUnit.METER, 8),
+                (2, ForceUnit.NEWTON * LengthUnit.CENTI_METER, 200),
+            ]
+        )
 
-    @args({"value": 2, "from_descriptor": EnergyUnit.WATTHOUR})
-    def test_from_watthour(self):
-        self.assertResult(7200)
 
-    @args({"value": 7, "from_descriptor": EnergyUnit.KILO_WATTHOUR})
-    def test_from_kilo_watthour(self):
-        self.assertResultAlmost(7 * 3600 * 1000)
+class TestAliasPowerUnitConverterConvertToReference(TestConvertToReference):
+    converter = AliasPowerUnitConverter
 
+    def test_convert(self):
+        self.assert_cases(
+            [
+                (10.02, PowerUnit.WATT, 10.02),
+                (0.032, PowerUnit.KILO_WATT, 32),
+                (22, PowerUnit.MEGA_WATT, 22_000_000),
+                (5.0201, PowerUnit.GIGA_WATT, 5_020_100_000),
+            ]
+        )
 
-@add_to(AliasEnergyUnitConverter_test_suite)
-class TestAliasEnergyUnitConverterConvertFromReference(TestCase):
-    def subject(self, value, to_descriptor):
-        return AliasEnergyUnitConverter.convert(value, EnergyUnit.JOULE, to_descriptor)
-
-    @args({"value": 10.32, "to_descriptor": EnergyUnit.JOULE})
-    def test_to_joule(self):
-        self.assertResult(10.32)
-
-    @args({"value": 5_000, "to_descriptor": EnergyUnit.KILO_JOULE})
-    def test_to_kilo_joule(self):
-        self.assertResult(5)
-
-    @args({"value": 67_032, "to_descriptor": EnergyUnit.MEGA_JOULE})
-    def test_to_mega_joule(self):
-        self.assertResult(0.067032)
-
-    @args({"value": 232_001, "to_descriptor": EnergyUnit.GIGA_JOULE})
-    def test_to_giga_joule(self):
-        self.assertResultAlmost(0.000232001, 9)
-
-    @args({"value": 10, "to_descriptor": EnergyUnit.CALORIE})
-    def test_to_calorie(self):
-        self.assertResult(10 / 4.184)
-
-    @args({"value": 3_200, "to_descriptor": EnergyUnit.KILO_CALORIE})
-    def test_to_kilo_calorie(self):
-        self.assertResultAlmost(3200 / 4.184 / 1000, 4)
-
-    @args({"value": 5_000, "to_descriptor": EnergyUnit.BTU})
-    def test_to_btu(self):
-        self.assertResult(5000 / 1055)
-
-    @args({"value": 5.27002e-16, "to_descriptor": EnergyUnit.ELECTRONVOLT})
-    def test_to_electronvolt(self):
-        self.assertResultAlmost(5.27002e-16 * 6.242e18)
-
-    @args({"value": 8_000, "to_descriptor": EnergyUnit.WATTHOUR})
-    def test_to_watthour(self):
-        self.assertResult(8000 / 3600)
-
-    @args({"value": 100_000, "to_descriptor": EnergyUnit.KILO_WATTHOUR})
-    def test_to_kilo_watthour(self):
-        self.assertResultAlmost(100_000 / 3600 / 1000)
-
-    @args(
-        {
-            "value": 20.1,
-            "to_descriptor": MassUnit.KILO_GRAM
-            * (LengthUnit.METER**2)
-            / (TimeUnit.SECOND**2),
-        }
-    )
-    def test_to_aliased_si_units(self):
-        self.assertResult(20.1)
-
-    @args(
-        {
-            "value": 7,
-            "to_descriptor": MassUnit.GRAM
-            * (LengthUnit.METER**2)
-            / (TimeUnit.SECOND**2),
-        }
-    )
-    def test_to_aliased_units(self):
-        self.assertResult(7_000)
-
-    @args({"value": 8, "to_descriptor": ForceUnit.NEWTON * LengthUnit.METER})
-    def test_to_composite_si_units(self):
-        self.assertResult(8)
-
-    @args({"value": 2, "to_descriptor": ForceUnit.NEWTON * LengthUnit.CENTI_METER})
-    def test_to_composite_units(self):
-        self.assertResult(200)
-
-
-@add_to(AliasPowerUnitConverter_test_suite)
-class TestAliasPowerUnitConverterConvertToReference(TestCase):
-    def subject(self, value, from_descriptor):
-        return AliasPowerUnitConverter.convert(value, from_descriptor, PowerUnit.WATT)
 
-    @args({"value": 10.02, "from_descriptor": PowerUnit.WATT})
-    def test_from_watt(self):
-        self.assertResult(10.02)
+class TestAliasPowerUnitConverterConvertFromReference(TestConvertFromReference):
+    converter = AliasPowerUnitConverter
+
+    def test_convert(self):
+        self.assert_cases(
+            [
+                (29, PowerUnit.WATT, 29),
+                (55.5, PowerUnit.KILO_WATT, 0.0555),
+                (17_001.9, PowerUnit.MEGA_WATT, 0.0170019),
+                (5, PowerUnit.GIGA_WATT, 5e-9),
+                (
+                    9,
+                    MassUnit.KILO_GRAM * (LengthUnit.METER**2) / (TimeUnit.SECOND**3),
+                    9,
+                ),
+                (
+                    9,
+                    MassUnit.GRAM * (LengthUnit.METER**2) / (TimeUnit.SECOND**3),
+                    9_000,
+                ),
+                (6, EnergyUnit.JOULE / TimeUnit.SECOND, 6),
+                (9, EnergyUnit.WATTHOUR / TimeUnit.HOUR, 9),
+            ]
+        )
 
-    @args({"value": 0.032, "from_descriptor": PowerUnit.KILO_WATT})
-    def test_from_kilo_watt(self):
-        self.assertResult(32)
 
-    @args({"value": 22, "from_descriptor": PowerUnit.MEGA_WATT})
-    def test_from_watt(self):
-        self.assertResult(22_000_000)
+class TestIdentityConversions(TestCase):
+    """
+    Converting a value to the unit it is already in skips the round trip through the
+    reference unit.
+    """
 
-    @args({"value": 5.0201, "from_descriptor": PowerUnit.GIGA_WATT})
-    def test_from_watt(self):
-        self.assertResult(5_020_100_000)
+    def test_absolute_converter(self):
+        result = LengthUnitConverter.convert(3, LengthUnit.FOOT, LengthUnit.FOOT)
+        self.assertIs(type(result), float)
+        self.assertEqual(result, 3)
 
+    def test_relative_converter(self):
+        result = RelativeTemperatureUnitConverter.convert(
+            3, RelativeTemperatureUnit.FAHRENHEIT, RelativeTemperatureUnit.FAHRENHEIT
+        )
+        self.assertIs(type(result), int)
+        self.assertEqual(result, 3)
+
+    def test_relative_converter_with_float(self):
+        value = 2.5
+        self.assertIs(
+            RelativeTemperatureUnitConverter.convert(
+                value, RelativeTemperatureUnit.CELCIUS, RelativeTemperatureUnit.CELCIUS
+            ),
+            value,
+        )
 
-@add_to(AliasPowerUnitConverter_test_suite)
-class TestAliasPowerUnitConverterConvertFromReference(TestCase):
-    def subject(self, value, to_descriptor):
-        return AliasPowerUnitConverter.convert(value, PowerUnit.WATT, to_descriptor)
-
-    @args({"value": 29, "to_descriptor": PowerUnit.WATT})
-    def test_to_watt(self):
-        self.assertResult(29)
-
-    @args({"value": 55.5, "to_descriptor": PowerUnit.KILO_WATT})
-    def test_to_kilo_watt(self):
-        self.assertResult(0.0555)
-
-    @args({"value": 17_001.9, "to_descriptor": PowerUnit.MEGA_WATT})
-    def test_to_mega_watt(self):
-        self.assertResult(0.0170019)
-
-    @args({"value": 5, "to_descriptor": PowerUnit.GIGA_WATT})
-    def test_to_giga_watt(self):
-        self.assertResult(5e-9)
-
-    @args(
-        {
-            "value": 9,
-            "to_descriptor": MassUnit.KILO_GRAM
-            * (LengthUnit.METER**2)
-            / (TimeUnit.SECOND**3),
-        }
-    )
-    def test_to_aliased_si_units(self):
-        self.assertResult(9)
-
-    @args(
-        {
-            "value": 9,
-            "to_descriptor": MassUnit.GRAM
-            * (LengthUnit.METER**2)
-            / (TimeUnit.SECOND**3),
-        }
-    )
-    def test_to_aliased_units(self):
-        self.assertResult(9_000)
-
-    @args({"value": 6, "to_descriptor": EnergyUnit.JOULE / TimeUnit.SECOND})
-    def test_to_composite_si_units(self):
-        self.assertResult(6)
-
-    @args({"value": 9, "to_descriptor": EnergyUnit.WATTHOUR / TimeUnit.HOUR})
-    def test_to_composite_units(self):
-        self.assertResult(9)
+    def test_absolute_temperature_converter(self):
+        result = AbsoluteTemperatureUnitConverter.convert(
+            3, AbsoluteTemperatureUnit.RANKINE, AbsoluteTemperatureUnit.RANKINE
+        )
+        self.assertIs(type(result), int)
+        self.assertEqual(result, 3)
 
 
 if __name__ == "__main__":
-    runner = TextTestRunner()
-    runner.run(converters_test_suite)
+    main()
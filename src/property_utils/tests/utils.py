@@ -1,30 +1,44 @@
 from typing import Iterable
 from collections import Counter
+from functools import lru_cache
 from importlib import import_module
 
 
-def add_to(test_suite, method_name=None):
-
-    def wrapper(cls):
-        for test_method in {m for m in dir(cls) if m.startswith("test_")}:
-            test_suite.addTest(cls(test_method))
-        if method_name is not None:
-            setattr(cls, "_method", method_name)
-        return cls
-
-    return wrapper
-
-
 def def_load_tests(module_path):
 
     def load_tests(loader, tests, ignore):
-        from doctest import DocTestSuite
-
-        tests.addTests(DocTestSuite(import_module(module_path)))
+        tests.addTests(_doctest_suite(module_path))
         return tests
 
     return load_tests
 
 
+@lru_cache(maxsize=None)
+def _doctest_suite(module_path):
+    """
+    Builds the doctest suite of the module once; repeated test discoveries reuse it.
+    """
+    from doctest import DocTestSuite
+
+    return DocTestSuite(import_module(module_path))
+
+
 def ids(iterable: Iterable) -> Counter:
     return Counter(map(id, iterable))
+
+
+def assert_cases(test_case, cases, subject, check=None) -> None:
+    """
+    Runs `subject(**arguments)` for the `(arguments, expected, *extra)` rows of
+    `cases` as sub tests of `test_case`. If `expected` is an exception class the call
+    must raise it; otherwise `check(result, expected, *extra)` asserts on the result
+    (`test_case.assertEqual` by default).
+    """
+    check = check or test_case.assertEqual
+    for arguments, expected, *extra in cases:
+        with test_case.subTest(**arguments):
+            if isinstance(expected, type) and issubclass(expected, Exception):
+                with test_case.assertRaises(expected):
+                    subject(**arguments)
+            else:
+                check(subject(**arguments), expected, *extra)
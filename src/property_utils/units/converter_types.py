@@ -10,7 +10,18 @@ Converters implement a 2-step process to convert 'from_unit' to 'to_unit'.
 """
 
 from abc import ABCMeta
-from typing import Protocol, Type, Callable, Dict
+from functools import lru_cache
+from typing import (
+    Protocol,
+    Type,
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+    Any,
+    Union,
+    TypeVar,
+)
 
 try:
     from typing import TypeAlias  # Python >= 3.10
@@ -42,6 +53,10 @@ from property_utils.exceptions.base import (
 
 ConverterType: TypeAlias = Type["UnitConverter"]
 
+_DescriptorKey: TypeAlias = Union[MeasurementUnit, Tuple[Any, ...]]
+
+_T = TypeVar("_T")
+
 _converters: Dict[GenericUnitDescriptor, ConverterType] = {}
 
 
@@ -61,20 +76,22 @@ def get_converter(generic: GenericUnitDescriptor) -> ConverterType:
         )
     if isinstance(generic, GenericDimension) and generic.power == 1:
         generic = generic.unit_type
-    elif isinstance(generic, GenericDimension) and generic not in _converters:
-        register_converter(generic)(
+
+    # generic descriptors hash by their string representation; probe the registry
+    # once instead of a membership test followed by a lookup.
+    converter = _converters.get(generic)
+    if converter is not None:
+        return converter
+
+    if isinstance(generic, GenericDimension):
+        return register_converter(generic)(
             type(f"{generic}_Converter", (ExponentiatedUnitConverter,), {})
         )
-    elif isinstance(generic, GenericCompositeDimension) and generic not in _converters:
-        register_converter(generic)(
+    if isinstance(generic, GenericCompositeDimension):
+        return register_converter(generic)(
             type(f"{generic}_Converter", (CompositeUnitConverter,), {})
         )
-    try:
-        return _converters[generic]
-    except KeyError:
-        raise UndefinedConverterError(
-            f"a converter has not been defined for {generic}"
-        ) from None
+    raise UndefinedConverterError(f"a converter has not been defined for {generic}")
 
 
 def register_converter(generic: GenericUnitDescriptor) -> Callable:
@@ -108,6 +125,72 @@ def register_converter(generic: GenericUnitDescriptor) -> Callable:
     return wrapper
 
 
+def _descriptor_key(descriptor: UnitDescriptor) -> Optional[_DescriptorKey]:
+    """
+    Returns a hashable key made of the type, units and powers of the given descriptor,
+    or None if the descriptor is not a measurement unit, dimension or composite
+    dimension.
+
+    Dimensions are mutable, so they cannot be used as cache keys themselves; the key
+    is a snapshot that `_descriptor_from_key` turns back into an equal descriptor.
+    """
+    if isinstance(descriptor, MeasurementUnit):
+        return descriptor
+    if type(descriptor) is Dimension:  # pylint: disable=unidiomatic-typecheck
+        return (Dimension, descriptor.unit, descriptor.power)
+    if type(descriptor) is CompositeDimension:  # pylint: disable=unidiomatic-typecheck
+        return (
+            CompositeDimension,
+            tuple((n.unit, n.power) for n in descriptor.numerator),
+            tuple((d.unit, d.power) for d in descriptor.denominator),
+        )
+    return None
+
+
+def _descriptor_from_key(key: _DescriptorKey) -> UnitDescriptor:
+    """
+    Returns a descriptor equal to the one the given key was made from.
+    """
+    if isinstance(key, MeasurementUnit):
+        return key
+    if key[0] is Dimension:
+        return Dimension(key[1], key[2])
+    return CompositeDimension(
+        [Dimension(unit, power) for unit, power in key[1]],
+        [Dimension(unit, power) for unit, power in key[2]],
+    )
+
+
+def _cached_call(
+    function: Callable[[UnitDescriptor, UnitDescriptor], _T],
+    from_descriptor: UnitDescriptor,
+    to_descriptor: UnitDescriptor,
+) -> _T:
+    """
+    Returns `function(from_descriptor, to_descriptor)`, cached per function and pair
+    of descriptor keys.
+
+    Converters use this for the lookups that only depend on their conversion maps and
+    dependencies, which are fixed when a converter is defined; the lookups then
+    happen once per pair of units instead of once per conversion. Descriptors
+    without a key (see `_descriptor_key`) are not cached.
+    """
+    from_key = _descriptor_key(from_descriptor)
+    to_key = _descriptor_key(to_descriptor)
+    if from_key is None or to_key is None:
+        return function(from_descriptor, to_descriptor)
+    return _keyed_call(function, from_key, to_key)
+
+
+@lru_cache(maxsize=512)
+def _keyed_call(
+    function: Callable[[UnitDescriptor, UnitDescriptor], _T],
+    from_key: _DescriptorKey,
+    to_key: _DescriptorKey,
+) -> _T:
+    return function(_descriptor_from_key(from_key), _descriptor_from_key(to_key))
+
+
 class UnitConverter(Protocol):  # pylint: disable=too-few-public-methods
     """Protocol of classes that convert a value from one unit to another."""
 
@@ -173,6 +256,10 @@ class AbsoluteUnitConverter(metaclass=ABCMeta):
         an instance of the generic that is registered with the converter or if `value`
         is not a numeric.
 
+        Converting to the same unit multiplies `value` by exactly 1.0, so the result
+        is a float equal to `value`, without the rounding of a round trip through the
+        reference unit.
+
         Examples:
             >>> class LengthUnit(MeasurementUnit):
             ...     CENTI_METER = "cm"
@@ -213,6 +300,15 @@ class AbsoluteUnitConverter(metaclass=ABCMeta):
             >>> LengthUnitConverter.get_factor(LengthUnit.INCH, LengthUnit.CENTI_METER)
             2.54
         """
+        if from_descriptor is to_descriptor and from_descriptor in cls.conversion_map:
+            # identity conversion; also avoids the rounding of 1 / factor * factor.
+            return 1.0
+        return _cached_call(cls._get_factor, from_descriptor, to_descriptor)
+
+    @classmethod
+    def _get_factor(
+        cls, from_descriptor: UnitDescriptor, to_descriptor: UnitDescriptor
+    ) -> float:
         if not from_descriptor.isinstance_equivalent(cls.generic_unit_descriptor):
             raise UnitConversionError(
                 f"invalid 'from_descriptor; expected an instance-equivalent of {cls.generic_unit_descriptor}. "
@@ -330,6 +426,9 @@ class RelativeUnitConverter(
         an instance of the generic that is registered with the converter or if `value`
         is not a numeric.
 
+        Converting to the same unit returns `value` itself (an int stays an int); the
+        conversion functions are not called.
+
         Raises `ConversionFunctionError` if an error occurs when calling a function
         provided in the conversion_map or reference_conversion_map.
 
@@ -355,43 +454,75 @@ class RelativeUnitConverter(
         """
         if not isinstance(value, (float, int)):
             raise UnitConversionError(f"invalid 'value': {value}; expected numeric. ")
-        return cls._from_reference(
-            cls._to_reference(value, from_descriptor), to_descriptor
+        if cls._is_identity(from_descriptor, to_descriptor):
+            return value
+        to_reference, from_reference = _cached_call(
+            cls._get_conversion_functions, from_descriptor, to_descriptor
+        )
+        return cls._apply(from_reference, cls._apply(to_reference, value))
+
+    @classmethod
+    def _is_identity(
+        cls, from_descriptor: UnitDescriptor, to_descriptor: UnitDescriptor
+    ) -> bool:
+        """
+        Returns True if both descriptors are the same unit of the converter, in which
+        case the conversion functions need not be called.
+        """
+        return (
+            from_descriptor is to_descriptor
+            and from_descriptor in cls.conversion_map
+            and from_descriptor in cls.reference_conversion_map
+        )
+
+    @classmethod
+    def _get_conversion_functions(
+        cls, from_descriptor: UnitDescriptor, to_descriptor: UnitDescriptor
+    ) -> Tuple[Callable[[float], float], Callable[[float], float]]:
+        """
+        Returns the function that converts from `from_descriptor` to the reference
+        unit and the function that converts from the reference unit to
+        `to_descriptor`.
+        """
+        return (
+            cls._get_to_reference_function(from_descriptor),
+            cls._get_from_reference_function(to_descriptor),
         )
 
     @classmethod
-    def _to_reference(cls, value: float, from_descriptor: UnitDescriptor) -> float:
+    def _get_to_reference_function(
+        cls, from_descriptor: UnitDescriptor
+    ) -> Callable[[float], float]:
         if not from_descriptor.isinstance(cls.generic_unit_descriptor):
             raise UnitConversionError(
                 f"invalid 'from_descriptor; expected an instance of {cls.generic_unit_descriptor}. "
             )
         from_unit = MeasurementUnit.from_descriptor(from_descriptor)
         try:
-            conversion_func = cls.conversion_map[from_unit]
+            return cls.conversion_map[from_unit]
         except KeyError:
             raise UnitConversionError(
                 f"cannot convert from {from_unit}; unit is not in {cls.__name__}'s conversion map. ",
             ) from None
-        try:
-            return conversion_func(value)
-        except Exception as exc:
-            raise ConversionFunctionError(
-                f"an error occured in a conversion function of {cls.__name__}. ", exc
-            ) from exc
 
     @classmethod
-    def _from_reference(cls, value: float, to_descriptor: UnitDescriptor) -> float:
+    def _get_from_reference_function(
+        cls, to_descriptor: UnitDescriptor
+    ) -> Callable[[float], float]:
         if not to_descriptor.isinstance(cls.generic_unit_descriptor):
             raise UnitConversionError(
                 f"invalid 'to_descriptor'; expected an instance of {cls.generic_unit_descriptor}. "
             )
         to_unit = MeasurementUnit.from_descriptor(to_descriptor)
         try:
-            conversion_func = cls.reference_conversion_map[to_unit]
+            return cls.reference_conversion_map[to_unit]
         except KeyError:
             raise UnitConversionError(
                 f"cannot convert to {to_unit}; unit is not registered in {cls.__name__}'s reference conversion map. ",
             ) from None
+
+    @classmethod
+    def _apply(cls, conversion_func: Callable[[float], float], value: float) -> float:
         try:
             return conversion_func(value)
         except Exception as exc:
@@ -496,6 +627,12 @@ class ExponentiatedUnitConverter(metaclass=ABCMeta):
             >>> AreaUnitConverter.get_factor(LengthUnit.INCH**2, LengthUnit.CENTI_METER**2)
             6.4516
         """
+        return _cached_call(cls._get_factor, from_descriptor, to_descriptor)
+
+    @classmethod
+    def _get_factor(
+        cls, from_descriptor: UnitDescriptor, to_descriptor: UnitDescriptor
+    ) -> float:
         if not from_descriptor.isinstance_equivalent(cls.generic_unit_descriptor):
             raise UnitConversionError(
                 f"invalid 'from_descriptor; expected an instance-equivalent of {cls.generic_unit_descriptor}. "
@@ -681,6 +818,12 @@ class CompositeUnitConverter(metaclass=ABCMeta):
             >>> VelocityUnitConverter.get_factor(LengthUnit.INCH/TimeUnit.SECOND, LengthUnit.INCH/TimeUnit.MINUTE)
             60.0
         """
+        return _cached_call(cls._get_factor, from_descriptor, to_descriptor)
+
+    @classmethod
+    def _get_factor(
+        cls, from_descriptor: UnitDescriptor, to_descriptor: UnitDescriptor
+    ) -> float:
         if not from_descriptor.isinstance_equivalent(cls.generic_unit_descriptor):
             raise UnitConversionError(
                 f"invalid 'from_descriptor; expected an instance-equivalent of {cls.generic_unit_descriptor}. "
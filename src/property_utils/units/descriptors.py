@@ -11,7 +11,7 @@ can represent e.g. a temperature unit, a volume unit, a reaction rate unit etc.
 from enum import Enum, EnumMeta
 from typing import List, Union, Protocol, Optional, TypeVar, Dict
 from collections import Counter
-from dataclasses import dataclass, field, replace
+from dataclasses import dataclass, replace
 
 try:
     from typing import TypeAlias  # Python >= 3.10 pylint: disable=ungrouped-imports
@@ -26,6 +26,19 @@ from property_utils.exceptions.units.descriptors import (
 )
 
 
+def _same_elements(first: List, second: List) -> bool:
+    """
+    Returns True if both lists hold the same elements regardless of their order, i.e.
+    if their element counts are equal.
+
+    The counts are compared as plain dicts; `Counter.__eq__` loops over the keys in
+    Python, which dominates the equality of composite dimensions.
+    """
+    if len(first) != len(second):
+        return False
+    return dict.__eq__(Counter(first), Counter(second))
+
+
 class GenericUnitDescriptor(Protocol):
     """
     Descriptor for a property unit that does not have a specific unit.
@@ -489,14 +502,16 @@ class MeasurementUnit(Enum, metaclass=MeasurementUnitMeta):
 
         return Dimension(self, power)
 
+    # `_value_` is read directly; the `value` property costs a descriptor call and
+    # units are hashed on every converter and descriptor lookup.
     def __hash__(self) -> int:
-        return hash(self.value)
+        return hash(self._value_)
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}: {str(self)}>"
 
     def __str__(self) -> str:
-        return self.value
+        return self._value_
 
 
 # mypy does treat Type[MeasurementUnit] and MeasurementUnitMeta as equals.
@@ -589,8 +604,10 @@ class GenericDimension:
         <GenericDimension: MassUnit^2>
     """
 
+    __slots__ = ("unit_type", "power")
+
     unit_type: MeasurementUnitType
-    power: float = 1
+    power: float
 
     def __init__(self, unit_type: MeasurementUnitType, power: float = 1) -> None:
         if not isinstance(power, (float, int)):
@@ -805,8 +822,10 @@ class Dimension:
         <Dimension: s^2>
     """
 
+    __slots__ = ("unit", "power")
+
     unit: MeasurementUnit
-    power: float = 1
+    power: float
 
     def __init__(self, unit: MeasurementUnit, power: float = 1) -> None:
         if not isinstance(power, (float, int)):
@@ -869,7 +888,8 @@ class Dimension:
             False
         """
         if isinstance(generic, MeasurementUnitType):
-            generic = GenericDimension(generic)
+            # same as comparing with GenericDimension(generic), without creating it.
+            return self.power == 1 and isinstance(self.unit, generic)
         if not isinstance(generic, GenericDimension):
             return False
 
@@ -1057,7 +1077,7 @@ class Dimension:
         return f"<Dimension: {self.unit.value}>"
 
     def __str__(self) -> str:
-        s = self.unit.value
+        s = self.unit._value_  # skips the Enum.value property lookup
         if self.power != 1:
             return f"({s}^{self.power})"
         return s
@@ -1084,8 +1104,18 @@ class GenericCompositeDimension:
         <GenericCompositeDimension: (LengthUnit^3) / AmountUnit>
     """
 
-    numerator: List[GenericDimension] = field(default_factory=list)
-    denominator: List[GenericDimension] = field(default_factory=list)
+    __slots__ = ("numerator", "denominator")
+
+    numerator: List[GenericDimension]
+    denominator: List[GenericDimension]
+
+    def __init__(
+        self,
+        numerator: Optional[List[GenericDimension]] = None,
+        denominator: Optional[List[GenericDimension]] = None,
+    ) -> None:
+        self.numerator = [] if numerator is None else numerator
+        self.denominator = [] if denominator is None else denominator
 
     def to_si(self) -> "CompositeDimension":
         """
@@ -1304,7 +1334,7 @@ class GenericCompositeDimension:
         """
         if isinstance(other, MeasurementUnitType):
             if (
-                self.denominator == []
+                not self.denominator
                 and len(self.numerator) == 1
                 and self.numerator[0].is_equivalent(other)
             ):
@@ -1315,7 +1345,7 @@ class GenericCompositeDimension:
 
         elif isinstance(other, GenericDimension):
             if (
-                self.denominator == []
+                not self.denominator
                 and len(self.numerator) == 1
                 and self.numerator[0].is_equivalent(other)
             ):
@@ -1330,8 +1360,8 @@ class GenericCompositeDimension:
             _generic = other.analysed().simplified()
             _self = self.analysed().simplified()
 
-            return Counter(_self.numerator) == Counter(_generic.numerator) and (
-                Counter(_self.denominator) == Counter(_generic.denominator)
+            return _same_elements(_self.numerator, _generic.numerator) and (
+                _same_elements(_self.denominator, _generic.denominator)
             )
 
         return False
@@ -1457,26 +1487,22 @@ class GenericCompositeDimension:
         """
         if not isinstance(generic, GenericCompositeDimension):
             return False
-        return Counter(self.numerator) == Counter(generic.numerator) and (
-            Counter(self.denominator) == Counter(generic.denominator)
+        return _same_elements(self.numerator, generic.numerator) and (
+            _same_elements(self.denominator, generic.denominator)
         )
 
     def __hash__(self) -> int:
         return hash(str(self))
 
     def __str__(self) -> str:
-        numerators = " * ".join(sorted([str(n) for n in self.numerator]))
-        denominators = " / ".join(sorted([str(d) for d in self.denominator]))
-        if len(denominators) > 0:
-            denominators = " / " + denominators
-        return numerators + denominators
+        numerators = " * ".join(sorted(str(n) for n in self.numerator))
+        denominators = " / ".join(sorted(str(d) for d in self.denominator))
+        if denominators:
+            return f"{numerators} / {denominators}"
+        return numerators
 
     def __repr__(self) -> str:
-        numerators = " * ".join(sorted([str(n) for n in self.numerator]))
-        denominators = " / ".join(sorted([str(d) for d in self.denominator]))
-        if len(denominators) > 0:
-            denominators = " / " + denominators
-        return f"<GenericCompositeDimension: {numerators + denominators}>"
+        return f"<GenericCompositeDimension: {self}>"
 
 
 @dataclass
@@ -1502,10 +1528,20 @@ class CompositeDimension:
         <CompositeDimension: (m^3) / kmol>
     """
 
+    __slots__ = ("numerator", "denominator")
+
     Default = TypeVar("Default")  # default return type for `get` functions.
 
-    numerator: List[Dimension] = field(default_factory=list)
-    denominator: List[Dimension] = field(default_factory=list)
+    numerator: List[Dimension]
+    denominator: List[Dimension]
+
+    def __init__(
+        self,
+        numerator: Optional[List[Dimension]] = None,
+        denominator: Optional[List[Dimension]] = None,
+    ) -> None:
+        self.numerator = [] if numerator is None else numerator
+        self.denominator = [] if denominator is None else denominator
 
     @staticmethod
     def from_descriptor(descriptor: UnitDescriptor) -> "CompositeDimension":
@@ -1900,23 +1936,19 @@ class CompositeDimension:
         """
         if not isinstance(dimension, CompositeDimension):
             return False
-        return Counter(self.numerator) == Counter(dimension.numerator) and (
-            Counter(self.denominator) == Counter(dimension.denominator)
+        return _same_elements(self.numerator, dimension.numerator) and (
+            _same_elements(self.denominator, dimension.denominator)
         )
 
     def __hash__(self) -> int:
         return hash(str(self))
 
-    def __str__(self):
-        numerators = " * ".join(sorted([str(n) for n in self.numerator]))
-        denominators = " / ".join(sorted([str(d) for d in self.denominator]))
-        if len(denominators) > 0:
-            denominators = " / " + denominators
-        return numerators + denominators
+    def __str__(self) -> str:
+        numerators = " * ".join(sorted(str(n) for n in self.numerator))
+        denominators = " / ".join(sorted(str(d) for d in self.denominator))
+        if denominators:
+            return f"{numerators} / {denominators}"
+        return numerators
 
     def __repr__(self) -> str:
-        numerators = " * ".join(sorted([str(n) for n in self.numerator]))
-        denominators = " / ".join(sorted([str(d) for d in self.denominator]))
-        if len(denominators) > 0:
-            denominators = " / " + denominators
-        return f"<CompositeDimension: {numerators + denominators}>"
+        return f"<CompositeDimension: {self}>"